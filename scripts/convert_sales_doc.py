@@ -3,117 +3,303 @@
 Convert DataMigrate AI Sales Document from Markdown to Word (.docx)
 """
 
-import re
+import hashlib
+import os
+import shutil
+from copy import deepcopy
+import docx
 from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.style import WD_STYLE_TYPE
-from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.shared import Emu, Pt, RGBColor
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls
+from docx.text.paragraph import Paragraph
+from jinja2 import Environment
 from pathlib import Path
+from typing import NamedTuple, Tuple
+from xml.sax.saxutils import escape
+
+
+_BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Output location, resolved once; python-docx opens a plain str path directly
+_OUTPUT_PATH = str(_BASE_DIR / 'docs' / 'DATAMIGRATE_AI_SALES_DOCUMENT_v2.docx')
+os.makedirs(os.path.dirname(_OUTPUT_PATH), exist_ok=True)
+
+# Previously built documents, keyed by a hash of the inputs that produced them
+_BUILD_CACHE_DIR = _BASE_DIR / '.build_cache'
+
+# Font overrides for the styles this document uses: (style name, size, color)
+_STYLE_OVERRIDES = (
+    ('Title', Pt(28), RGBColor(79, 70, 229)),  # Indigo
+    ('Heading 1', Pt(20), RGBColor(79, 70, 229)),
+    ('Heading 2', Pt(16), RGBColor(99, 102, 241)),
+    ('Heading 3', Pt(14), RGBColor(67, 56, 202)),
+)
+
+# Paragraph prototypes, parsed once and cloned for every bullet/heading
+_BULLET_PROTO = parse_xml(
+    f'<w:p {nsdecls("w")}><w:pPr><w:pStyle w:val="ListBullet"/></w:pPr><w:r><w:t/></w:r></w:p>'
+)
+_HEADING_PROTOS = {
+    level: parse_xml(
+        f'<w:p {nsdecls("w")}><w:pPr><w:pStyle w:val="Heading{level}"/></w:pPr><w:r><w:t/></w:r></w:p>'
+    )
+    for level in (1, 2, 3)
+}
+
+# Table Grid table with a bold header row, compiled once and rendered per table
+_TABLE_TEMPLATE = Environment(autoescape=True).from_string(
+    f'<w:tbl {nsdecls("w")}>'
+    '<w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:type="auto" w:w="0"/>'
+    '{% if centered %}<w:jc w:val="center"/>{% endif %}'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+    'w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+    '<w:tblGrid>{% for _ in headers %}<w:gridCol w:w="{{ width }}"/>{% endfor %}</w:tblGrid>'
+    '<w:tr>{% for header in headers %}'
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{{ width }}"/>'
+    '{% if header_fill %}<w:shd w:fill="{{ header_fill }}"/>{% endif %}</w:tcPr>'
+    '<w:p><w:r><w:rPr><w:b/>{% if header_fill %}<w:color w:val="FFFFFF"/>{% endif %}</w:rPr>'
+    '<w:t>{{ header }}</w:t></w:r></w:p></w:tc>'
+    '{% endfor %}</w:tr>'
+    '{% for row in rows %}<w:tr>{% for cell in row %}'
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{{ width }}"/></w:tcPr>'
+    '<w:p><w:r><w:t>{{ cell }}</w:t></w:r></w:p></w:tc>'
+    '{% endfor %}</w:tr>{% endfor %}'
+    '</w:tbl>'
+)
+
+
+class Plan(NamedTuple):
+    """A pricing plan as listed in the Pricing Structure section."""
+    name: str
+    best_for: str
+    features: Tuple[str, ...]
+
+
+# Pricing plans (module-level so the feature tuples are built once)
+_PLANS = (
+    Plan(
+        'Starter Plan - $499/month',
+        'Small businesses, startups, pilot projects',
+        (
+            'Up to 25 database tables',
+            '1 MSSQL connection',
+            'Migration Agent (basic)',
+            'Email support',
+            '100GB data transfer/month',
+            'Basic documentation generation'
+        )
+    ),
+    Plan(
+        'Professional Plan - $1,499/month',
+        'Mid-size companies, growing teams',
+        (
+            'Up to 100 database tables',
+            '5 MSSQL connections',
+            'Migration Agent (full)',
+            'Customer Support Agent',
+            'Priority email & chat support',
+            '500GB data transfer/month',
+            'Advanced documentation',
+            'API access',
+            'Slack integration'
+        )
+    ),
+    Plan(
+        'Enterprise Plan - $4,999/month',
+        'Large enterprises, complex migrations',
+        (
+            'Unlimited database tables',
+            'Unlimited MSSQL connections',
+            'All seven AI Agents (Migration, Support, BI, Data Quality, Documentation, Security, ML)',
+            '24/7 dedicated support',
+            'Unlimited data transfer',
+            'Custom integrations',
+            'SSO/SAML authentication',
+            'Dedicated success manager',
+            'SLA guarantees (99.9% uptime)',
+            'On-premise deployment option',
+            'Custom training sessions',
+            'ML Fine-Tuning credits included'
+        )
+    )
+)
+
+_CONTACT_INFO = (
+    ('Sales Inquiries:', 'sales@datamigrate.ai'),
+    ('Technical Questions:', 'support@datamigrate.ai'),
+    ('Partnership Opportunities:', 'partners@datamigrate.ai')
+)
+
+
+def add_paragraph(body, text=None):
+    """Add a plain paragraph and return it for further formatting."""
+    paragraph = Paragraph(OxmlElement('w:p'), None)
+    if text:
+        paragraph.add_run(text)
+    body.append(paragraph._p)
+    return paragraph
+
+
+def add_page_break(body):
+    """Add a paragraph holding a single page break."""
+    add_paragraph(body).add_run().add_break(WD_BREAK.PAGE)
+
+
+def _append_paragraph(body, proto, text):
+    """Clone a paragraph prototype, set its text and append it to the body."""
+    p = deepcopy(proto)
+    p[1][0].text = text
+    body.append(p)
+
+
+def add_bullet(body, text):
+    """Add a List Bullet paragraph."""
+    _append_paragraph(body, _BULLET_PROTO, text)
+
+
+def add_heading(body, text, level):
+    """Add a Heading 1-3 paragraph."""
+    _append_paragraph(body, _HEADING_PROTOS[level], text)
+
+
+def add_bold_label_paragraph(body, label, text):
+    """Add a paragraph made of a bold label run followed by a plain text run."""
+    p = parse_xml(
+        f'<w:p {nsdecls("w")}>'
+        f'<w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve">{escape(label)}</w:t></w:r>'
+        f'<w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+        '</w:p>'
+    )
+    body.append(p)
+
+
+def add_data_table(body, block_width, headers, rows, header_fill=None, centered=False,
+                   bold_last_row=False, last_row_color=None):
+    """Render a Table Grid table with a bold header row and append it."""
+    tbl = parse_xml(_TABLE_TEMPLATE.render(
+        headers=headers,
+        rows=rows,
+        width=Emu(block_width // len(headers)).twips,
+        header_fill=header_fill,
+        centered=centered
+    ))
+
+    # Highlight the summary row in one pass over its runs
+    if bold_last_row or last_row_color:
+        color = f'<w:color w:val="{last_row_color}"/>' if last_row_color else ''
+        rPr = parse_xml(f'<w:rPr {nsdecls("w")}><w:b/>{color}</w:rPr>')
+        for r in tbl.xpath('./w:tr[last()]//w:r'):
+            r.insert(0, deepcopy(rPr))
+
+    body.append(tbl)
+
+
+def _build_key():
+    """Hash everything the document is built from: this script and python-docx."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(docx.__version__.encode())
+    return digest.hexdigest()
 
 
 def create_word_document():
     """Create a professionally formatted Word document from the sales content."""
 
+    output_path = _OUTPUT_PATH
+
+    # The document is fully determined by this script, so reuse an earlier build if present
+    cached_path = _BUILD_CACHE_DIR / f'{_build_key()}.docx'
+    if cached_path.exists():
+        shutil.copyfile(cached_path, output_path)
+        print(f'Word document created (cached): {output_path}')
+        return output_path
+
     doc = Document()
 
     # Set up styles
     styles = doc.styles
+    for style_name, size, color in _STYLE_OVERRIDES:
+        font = styles[style_name].font
+        font.size = size
+        font.color.rgb = color
+        font.bold = True
 
-    # Title style
-    title_style = styles['Title']
-    title_style.font.size = Pt(28)
-    title_style.font.color.rgb = RGBColor(79, 70, 229)  # Indigo
-    title_style.font.bold = True
-
-    # Heading 1 style
-    h1_style = styles['Heading 1']
-    h1_style.font.size = Pt(20)
-    h1_style.font.color.rgb = RGBColor(79, 70, 229)
-    h1_style.font.bold = True
-
-    # Heading 2 style
-    h2_style = styles['Heading 2']
-    h2_style.font.size = Pt(16)
-    h2_style.font.color.rgb = RGBColor(99, 102, 241)
-    h2_style.font.bold = True
-
-    # Heading 3 style
-    h3_style = styles['Heading 3']
-    h3_style.font.size = Pt(14)
-    h3_style.font.color.rgb = RGBColor(67, 56, 202)
-    h3_style.font.bold = True
+    # Body elements are built detached and attached to the document at the end
+    body = []
+    section = doc.sections[-1]
+    block_width = section.page_width - section.left_margin - section.right_margin
 
     # ===== COVER PAGE =====
-    doc.add_paragraph()
-    doc.add_paragraph()
-    doc.add_paragraph()
+    add_paragraph(body)
+    add_paragraph(body)
+    add_paragraph(body)
 
-    title = doc.add_paragraph()
+    title = add_paragraph(body)
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = title.add_run('DataMigrate AI')
     run.font.size = Pt(48)
     run.font.color.rgb = RGBColor(79, 70, 229)
     run.font.bold = True
 
-    subtitle = doc.add_paragraph()
+    subtitle = add_paragraph(body)
     subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = subtitle.add_run('Enterprise Sales Document')
     run.font.size = Pt(24)
     run.font.color.rgb = RGBColor(107, 114, 128)
 
-    doc.add_paragraph()
-    doc.add_paragraph()
+    add_paragraph(body)
+    add_paragraph(body)
 
-    tagline = doc.add_paragraph()
+    tagline = add_paragraph(body)
     tagline.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = tagline.add_run('Intelligent Data Migration for the Modern Enterprise')
     run.font.size = Pt(16)
     run.font.italic = True
     run.font.color.rgb = RGBColor(107, 114, 128)
 
-    doc.add_paragraph()
-    doc.add_paragraph()
-    doc.add_paragraph()
-    doc.add_paragraph()
+    add_paragraph(body)
+    add_paragraph(body)
+    add_paragraph(body)
+    add_paragraph(body)
 
     # Document info
-    info = doc.add_paragraph()
+    info = add_paragraph(body)
     info.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = info.add_run('Version 2.0 | December 2025 | Confidential')
     run.font.size = Pt(11)
     run.font.color.rgb = RGBColor(156, 163, 175)
 
-    doc.add_page_break()
+    add_page_break(body)
 
     # ===== EXECUTIVE SUMMARY =====
-    doc.add_heading('Executive Summary', level=1)
-    doc.add_paragraph(
+    add_heading(body, 'Executive Summary', 1)
+    add_paragraph(body,
         'DataMigrate AI is a revolutionary AI-powered platform that automates the migration of legacy '
         'MSSQL databases to modern dbt (data build tool) projects. Our multi-agent AI architecture '
         'delivers unprecedented speed, accuracy, and cost savings for enterprises looking to modernize '
         'their data infrastructure.'
     )
-    doc.add_paragraph()
+    add_paragraph(body)
 
     # ===== MISSION =====
-    doc.add_heading('Our Mission', level=1)
-    mission_para = doc.add_paragraph()
+    add_heading(body, 'Our Mission', 1)
+    mission_para = add_paragraph(body)
     run = mission_para.add_run(
         'To democratize data modernization by making legacy database migration accessible, affordable, '
         'and intelligent for organizations of all sizes.'
     )
     run.font.italic = True
     run.font.size = Pt(12)
-    doc.add_paragraph(
+    add_paragraph(body,
         'We believe every company deserves access to modern data analytics infrastructure without the '
         'prohibitive costs and technical barriers of traditional migration approaches.'
     )
-    doc.add_paragraph()
+    add_paragraph(body)
 
     # ===== VISION =====
-    doc.add_heading('Our Vision', level=1)
-    vision_para = doc.add_paragraph()
+    add_heading(body, 'Our Vision', 1)
+    vision_para = add_paragraph(body)
     run = vision_para.add_run(
         'To become the global leader in AI-powered data migration, enabling 10,000+ enterprises '
         'worldwide to transition from legacy systems to modern data stacks by 2028.'
@@ -121,7 +307,7 @@ def create_word_document():
     run.font.italic = True
     run.font.size = Pt(12)
 
-    doc.add_paragraph('We envision a future where:')
+    add_paragraph(body, 'We envision a future where:')
     bullets = [
         'Data migrations are completed in days, not months',
         'Zero-code solutions empower non-technical teams',
@@ -129,13 +315,13 @@ def create_word_document():
         'Every business decision is powered by accessible, clean data'
     ]
     for bullet in bullets:
-        doc.add_paragraph(bullet, style='List Bullet')
-    doc.add_paragraph()
+        add_bullet(body, bullet)
+    add_paragraph(body)
 
     # ===== STRATEGIC GOALS =====
-    doc.add_heading('Strategic Goals', level=1)
+    add_heading(body, 'Strategic Goals', 1)
 
-    doc.add_heading('Short-Term Goals (Year 1)', level=2)
+    add_heading(body, 'Short-Term Goals (Year 1)', 2)
     short_goals = [
         'Market Launch - Successfully deploy to 100+ enterprise customers',
         'Platform Stability - Achieve 99.9% uptime and reliability',
@@ -143,9 +329,9 @@ def create_word_document():
         'Feature Completion - Launch all three AI agents (Migration, Support, Business Intelligence)'
     ]
     for goal in short_goals:
-        doc.add_paragraph(goal, style='List Bullet')
+        add_bullet(body, goal)
 
-    doc.add_heading('Medium-Term Goals (Years 2-3)', level=2)
+    add_heading(body, 'Medium-Term Goals (Years 2-3)', 2)
     medium_goals = [
         'Market Expansion - Expand to European and Asian markets',
         'Revenue Growth - Achieve $10M ARR milestone',
@@ -153,9 +339,9 @@ def create_word_document():
         'Partnership Ecosystem - Establish partnerships with major cloud providers (AWS, Azure, GCP)'
     ]
     for goal in medium_goals:
-        doc.add_paragraph(goal, style='List Bullet')
+        add_bullet(body, goal)
 
-    doc.add_heading('Long-Term Goals (Years 4-5)', level=2)
+    add_heading(body, 'Long-Term Goals (Years 4-5)', 2)
     long_goals = [
         'Market Dominance - Capture 25% of the enterprise data migration market',
         'Product Suite - Expand to support all major database systems',
@@ -163,34 +349,21 @@ def create_word_document():
         'Global Presence - Operations in 20+ countries'
     ]
     for goal in long_goals:
-        doc.add_paragraph(goal, style='List Bullet')
+        add_bullet(body, goal)
 
-    doc.add_page_break()
+    add_page_break(body)
 
     # ===== COMPETITIVE ADVANTAGES =====
-    doc.add_heading('Competitive Advantages', level=1)
+    add_heading(body, 'Competitive Advantages', 1)
 
-    doc.add_heading('1. Eight-Agent AI Architecture', level=2)
-    doc.add_paragraph(
+    add_heading(body, '1. Eight-Agent AI Architecture', 2)
+    add_paragraph(body,
         'Unlike competitors who offer single-purpose tools, DataMigrate AI features a comprehensive '
         'eight-agent AI system with RAG, Security, and DataPrep capabilities:'
     )
 
     # Agent table
-    table = doc.add_table(rows=10, cols=3)
-    table.style = 'Table Grid'
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-
     headers = ['Agent', 'Function', 'Competitive Edge']
-    for i, header in enumerate(headers):
-        cell = table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].font.bold = True
-        cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-        from docx.oxml.ns import nsdecls
-        from docx.oxml import parse_xml
-        shading = parse_xml(f'<w:shd {nsdecls("w")} w:fill="4F46E5"/>')
-        cell._tc.get_or_add_tcPr().append(shading)
 
     agent_data = [
         ['Migration Agent', 'MSSQL to dbt conversion', '90% faster migrations'],
@@ -202,65 +375,55 @@ def create_word_document():
         ['ML Fine-Tuning Agent', 'Custom model training', 'Industry-specific AI'],
         ['DataPrep AI Agent', 'Data preparation & cleaning', 'Analytics & ML-ready data']
     ]
-    for row_idx, row_data in enumerate(agent_data, 1):
-        for col_idx, cell_data in enumerate(row_data):
-            table.rows[row_idx].cells[col_idx].text = cell_data
+    add_data_table(body, block_width, headers, agent_data, header_fill='4F46E5', centered=True)
 
-    doc.add_paragraph()
+    add_paragraph(body)
 
-    doc.add_heading('2. MSSQL Specialization', level=2)
-    doc.add_paragraph('While competitors offer generic migration tools, we specialize in:')
+    add_heading(body, '2. MSSQL Specialization', 2)
+    add_paragraph(body, 'While competitors offer generic migration tools, we specialize in:')
     specializations = [
         'Deep MSSQL Integration - Native understanding of SQL Server schemas, stored procedures, and data types',
         'Windows Authentication Support - Seamless enterprise security integration',
         'Complex Query Translation - Intelligent conversion of T-SQL to dbt models'
     ]
     for spec in specializations:
-        doc.add_paragraph(spec, style='List Bullet')
+        add_bullet(body, spec)
 
-    doc.add_heading('3. Cost Efficiency', level=2)
+    add_heading(body, '3. Cost Efficiency', 2)
     cost_benefits = [
         '70% lower cost than traditional consulting-based migrations',
         'No per-row pricing - Unlimited data migration',
         'Predictable pricing - Flat monthly subscription'
     ]
     for benefit in cost_benefits:
-        doc.add_paragraph(benefit, style='List Bullet')
+        add_bullet(body, benefit)
 
-    doc.add_heading('4. Speed to Value', level=2)
+    add_heading(body, '4. Speed to Value', 2)
 
-    speed_table = doc.add_table(rows=4, cols=3)
-    speed_table.style = 'Table Grid'
     speed_headers = ['Migration Size', 'Traditional Approach', 'DataMigrate AI']
-    for i, header in enumerate(speed_headers):
-        cell = speed_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].font.bold = True
 
     speed_data = [
         ['Small (10 tables)', '2-4 weeks', '1-2 days'],
         ['Medium (50 tables)', '2-3 months', '1-2 weeks'],
         ['Large (200+ tables)', '6-12 months', '4-6 weeks']
     ]
-    for row_idx, row_data in enumerate(speed_data, 1):
-        for col_idx, cell_data in enumerate(row_data):
-            speed_table.rows[row_idx].cells[col_idx].text = cell_data
+    add_data_table(body, block_width, speed_headers, speed_data)
 
-    doc.add_page_break()
+    add_page_break(body)
 
     # ===== MARKET COMPETITIVE ANALYSIS =====
-    doc.add_heading('Market Competitive Analysis', level=1)
-    doc.add_paragraph(
+    add_heading(body, 'Market Competitive Analysis', 1)
+    add_paragraph(body,
         'The data migration and transformation market is growing rapidly, but few solutions address '
         'the specific challenge of MSSQL to dbt migration with AI-powered automation.'
     )
 
-    doc.add_heading('Key Competitors', level=2)
+    add_heading(body, 'Key Competitors', 2)
 
     # Datafold
-    doc.add_heading('Datafold', level=3)
-    doc.add_paragraph('Focus: Data diff, migration testing, and CI/CD for data')
-    doc.add_paragraph('Strengths:')
+    add_heading(body, 'Datafold', 3)
+    add_paragraph(body, 'Focus: Data diff, migration testing, and CI/CD for data')
+    add_paragraph(body, 'Strengths:')
     datafold_strengths = [
         'Cross-database data diffing (primary differentiator)',
         'Strong focus on data validation and testing',
@@ -268,27 +431,21 @@ def create_word_document():
         'Column-level lineage tracking'
     ]
     for s in datafold_strengths:
-        doc.add_paragraph(s, style='List Bullet')
-    doc.add_paragraph('Our Advantage: DataMigrate AI provides end-to-end automation from MSSQL extraction to dbt model generation, while Datafold only validates migrations you\'ve already built manually.')
+        add_bullet(body, s)
+    add_paragraph(body, 'Our Advantage: DataMigrate AI provides end-to-end automation from MSSQL extraction to dbt model generation, while Datafold only validates migrations you\'ve already built manually.')
 
     # Mage AI
-    doc.add_heading('Mage AI', level=3)
-    doc.add_paragraph('Focus: Open-source data pipeline orchestration')
-    doc.add_paragraph('Our Advantage: Purpose-built for MSSQL to dbt with intelligent automation vs. manual pipeline building.')
+    add_heading(body, 'Mage AI', 3)
+    add_paragraph(body, 'Focus: Open-source data pipeline orchestration')
+    add_paragraph(body, 'Our Advantage: Purpose-built for MSSQL to dbt with intelligent automation vs. manual pipeline building.')
 
     # dbt Labs + Consultants
-    doc.add_heading('dbt Labs + Consulting Partners', level=3)
-    doc.add_paragraph('Focus: dbt Cloud professional services')
-    doc.add_paragraph('Our Advantage: AI-powered automation at 1/10th the cost with consistent, repeatable results.')
+    add_heading(body, 'dbt Labs + Consulting Partners', 3)
+    add_paragraph(body, 'Focus: dbt Cloud professional services')
+    add_paragraph(body, 'Our Advantage: AI-powered automation at 1/10th the cost with consistent, repeatable results.')
 
-    doc.add_heading('Competitive Feature Matrix', level=2)
-    comp_table = doc.add_table(rows=6, cols=4)
-    comp_table.style = 'Table Grid'
+    add_heading(body, 'Competitive Feature Matrix', 2)
     comp_headers = ['Feature', 'DataMigrate AI', 'Datafold', 'Consultants']
-    for i, header in enumerate(comp_headers):
-        cell = comp_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].font.bold = True
 
     comp_data = [
         ['MSSQL Specialization', '✓ Deep', '✗ Generic', '~ Varies'],
@@ -297,23 +454,18 @@ def create_word_document():
         ['Stored Proc Conversion', '✓ Automated', '✗ None', '~ Manual'],
         ['Cost Efficiency', '$$', '$$$', '$$$$$$']
     ]
-    for row_idx, row_data in enumerate(comp_data, 1):
-        for col_idx, cell_data in enumerate(row_data):
-            comp_table.rows[row_idx].cells[col_idx].text = cell_data
+    add_data_table(body, block_width, comp_headers, comp_data)
 
-    doc.add_paragraph()
-    unique_para = doc.add_paragraph()
-    run = unique_para.add_run('Our Unique Position: ')
-    run.font.bold = True
-    unique_para.add_run('DataMigrate AI is the only solution that combines MSSQL expertise, AI automation, dbt native output, and an eight-agent architecture with RAG, Security, and DataPrep capabilities.')
+    add_paragraph(body)
+    add_bold_label_paragraph(body, 'Our Unique Position: ', 'DataMigrate AI is the only solution that combines MSSQL expertise, AI automation, dbt native output, and an eight-agent architecture with RAG, Security, and DataPrep capabilities.')
 
-    doc.add_page_break()
+    add_page_break(body)
 
     # ===== AI AGENT SUITE =====
-    doc.add_heading('AI Agent Suite (8 Agents)', level=1)
+    add_heading(body, 'AI Agent Suite (8 Agents)', 1)
 
-    doc.add_heading('Agent 1: Migration Agent (Core Product)', level=2)
-    doc.add_heading('Capabilities', level=3)
+    add_heading(body, 'Agent 1: Migration Agent (Core Product)', 2)
+    add_heading(body, 'Capabilities', 3)
     migration_caps = [
         'Automated Schema Analysis - Scans and maps database structure',
         'Intelligent Data Type Mapping - Converts MSSQL types to dbt-compatible formats',
@@ -323,11 +475,11 @@ def create_word_document():
         'Rollback Support - Safe migration with recovery options'
     ]
     for cap in migration_caps:
-        doc.add_paragraph(cap, style='List Bullet')
+        add_bullet(body, cap)
 
-    doc.add_heading('Agent 2: Customer Support Agent', level=2)
-    doc.add_paragraph('AI-powered 24/7 customer support that reduces ticket resolution time and support costs.')
-    doc.add_heading('Capabilities', level=3)
+    add_heading(body, 'Agent 2: Customer Support Agent', 2)
+    add_paragraph(body, 'AI-powered 24/7 customer support that reduces ticket resolution time and support costs.')
+    add_heading(body, 'Capabilities', 3)
     support_caps = [
         'Intelligent Ticket Routing - Automatically categorizes and prioritizes issues',
         'Instant Response - Answers common questions in seconds',
@@ -337,17 +489,11 @@ def create_word_document():
         'Knowledge Base Integration - Learns from resolved tickets'
     ]
     for cap in support_caps:
-        doc.add_paragraph(cap, style='List Bullet')
+        add_bullet(body, cap)
 
     # Support benefits table
-    doc.add_paragraph()
-    support_table = doc.add_table(rows=5, cols=3)
-    support_table.style = 'Table Grid'
+    add_paragraph(body)
     support_headers = ['Metric', 'Without AI Agent', 'With AI Agent']
-    for i, header in enumerate(support_headers):
-        cell = support_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].font.bold = True
 
     support_data = [
         ['Average Response Time', '4-8 hours', '< 30 seconds'],
@@ -355,15 +501,13 @@ def create_word_document():
         ['Support Staff Needed', '5-10 agents', '1-2 agents'],
         ['Support Cost/Month', '$15,000+', '$3,000-5,000']
     ]
-    for row_idx, row_data in enumerate(support_data, 1):
-        for col_idx, cell_data in enumerate(row_data):
-            support_table.rows[row_idx].cells[col_idx].text = cell_data
+    add_data_table(body, block_width, support_headers, support_data)
 
-    doc.add_paragraph()
+    add_paragraph(body)
 
-    doc.add_heading('Agent 3: Business Intelligence Agent', level=2)
-    doc.add_paragraph('Transform your migrated data into strategic business insights and competitive advantages.')
-    doc.add_heading('Capabilities', level=3)
+    add_heading(body, 'Agent 3: Business Intelligence Agent', 2)
+    add_paragraph(body, 'Transform your migrated data into strategic business insights and competitive advantages.')
+    add_heading(body, 'Capabilities', 3)
     bi_caps = [
         'Automated Data Analysis - Discovers patterns and trends automatically',
         'Anomaly Detection - Identifies unusual data patterns and potential issues',
@@ -373,14 +517,14 @@ def create_word_document():
         'Competitive Intelligence - Benchmark analysis and market insights'
     ]
     for cap in bi_caps:
-        doc.add_paragraph(cap, style='List Bullet')
+        add_bullet(body, cap)
 
-    doc.add_paragraph()
+    add_paragraph(body)
 
     # Agent 4: Data Quality Agent
-    doc.add_heading('Agent 4: Data Quality Agent (NEW)', level=2)
-    doc.add_paragraph('Ensure data integrity and accuracy throughout the migration process with comprehensive validation and reconciliation.')
-    doc.add_heading('Capabilities', level=3)
+    add_heading(body, 'Agent 4: Data Quality Agent (NEW)', 2)
+    add_paragraph(body, 'Ensure data integrity and accuracy throughout the migration process with comprehensive validation and reconciliation.')
+    add_heading(body, 'Capabilities', 3)
     dq_caps = [
         'Cross-Database Data Diffing - Compare source MSSQL with target dbt models row-by-row',
         'Schema Validation - Verify all columns, types, and constraints are preserved',
@@ -390,14 +534,14 @@ def create_word_document():
         'Automated Reconciliation Reports - Generate compliance-ready documentation'
     ]
     for cap in dq_caps:
-        doc.add_paragraph(cap, style='List Bullet')
+        add_bullet(body, cap)
 
-    doc.add_paragraph()
+    add_paragraph(body)
 
     # Agent 5: Documentation Agent
-    doc.add_heading('Agent 5: Documentation Agent with RAG (NEW)', level=2)
-    doc.add_paragraph('Automatically generate comprehensive documentation for your migrated dbt project using RAG (Retrieval-Augmented Generation) technology.')
-    doc.add_heading('Capabilities', level=3)
+    add_heading(body, 'Agent 5: Documentation Agent with RAG (NEW)', 2)
+    add_paragraph(body, 'Automatically generate comprehensive documentation for your migrated dbt project using RAG (Retrieval-Augmented Generation) technology.')
+    add_heading(body, 'Capabilities', 3)
     doc_caps = [
         'Auto-Generated Model Documentation - Creates detailed descriptions for every dbt model',
         'Column-Level Documentation - Documents every field with business context',
@@ -406,11 +550,11 @@ def create_word_document():
         'dbt Docs Integration - Seamlessly integrates with dbt\'s documentation system'
     ]
     for cap in doc_caps:
-        doc.add_paragraph(cap, style='List Bullet')
+        add_bullet(body, cap)
 
-    doc.add_paragraph()
-    doc.add_heading('RAG Architecture', level=3)
-    doc.add_paragraph('Our Documentation Agent is powered by a sophisticated RAG (Retrieval-Augmented Generation) architecture:')
+    add_paragraph(body)
+    add_heading(body, 'RAG Architecture', 3)
+    add_paragraph(body, 'Our Documentation Agent is powered by a sophisticated RAG (Retrieval-Augmented Generation) architecture:')
 
     rag_components = [
         'Vector Database - ChromaDB/Pinecone/Weaviate for semantic document search',
@@ -420,17 +564,11 @@ def create_word_document():
         'Orchestration - LangChain/LlamaIndex for RAG pipeline management'
     ]
     for comp in rag_components:
-        doc.add_paragraph(comp, style='List Bullet')
+        add_bullet(body, comp)
 
-    doc.add_paragraph()
-    doc.add_heading('RAG Technology Stack', level=3)
-    rag_table = doc.add_table(rows=5, cols=2)
-    rag_table.style = 'Table Grid'
+    add_paragraph(body)
+    add_heading(body, 'RAG Technology Stack', 3)
     rag_headers = ['Component', 'Technology']
-    for i, header in enumerate(rag_headers):
-        cell = rag_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].font.bold = True
 
     rag_data = [
         ['Vector Store', 'ChromaDB / Pinecone / Weaviate'],
@@ -438,16 +576,14 @@ def create_word_document():
         ['LLM', 'GPT-4 / Claude 3 / LLaMA'],
         ['Orchestration', 'LangChain / LlamaIndex']
     ]
-    for row_idx, row_data in enumerate(rag_data, 1):
-        for col_idx, cell_data in enumerate(row_data):
-            rag_table.rows[row_idx].cells[col_idx].text = cell_data
+    add_data_table(body, block_width, rag_headers, rag_data)
 
-    doc.add_paragraph()
+    add_paragraph(body)
 
     # Agent 6: ML Fine-Tuning Agent
-    doc.add_heading('Agent 6: ML Fine-Tuning Agent (NEW)', level=2)
-    doc.add_paragraph('Enable customers to fine-tune open-source ML models on their own data, adding custom machine learning capabilities to their business.')
-    doc.add_heading('Capabilities', level=3)
+    add_heading(body, 'Agent 6: ML Fine-Tuning Agent (NEW)', 2)
+    add_paragraph(body, 'Enable customers to fine-tune open-source ML models on their own data, adding custom machine learning capabilities to their business.')
+    add_heading(body, 'Capabilities', 3)
     ml_caps = [
         'Model Selection - Choose from curated open-source models (LLaMA, Mistral, Falcon, etc.)',
         'Data Preparation - Automated data preprocessing and formatting for fine-tuning',
@@ -457,17 +593,11 @@ def create_word_document():
         'Industry Templates - Pre-configured fine-tuning recipes for Financial, Healthcare, Retail, Manufacturing'
     ]
     for cap in ml_caps:
-        doc.add_paragraph(cap, style='List Bullet')
+        add_bullet(body, cap)
 
     # ML Benefits table
-    doc.add_paragraph()
-    ml_table = doc.add_table(rows=5, cols=3)
-    ml_table.style = 'Table Grid'
+    add_paragraph(body)
     ml_headers = ['Benefit', 'Traditional Approach', 'With ML Agent']
-    for i, header in enumerate(ml_headers):
-        cell = ml_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].font.bold = True
 
     ml_data = [
         ['Time to Deploy ML', '3-6 months', '2-4 weeks'],
@@ -475,16 +605,14 @@ def create_word_document():
         ['Infrastructure Cost', '$50K-200K/year', 'Included'],
         ['Model Maintenance', 'Continuous effort', 'Automated']
     ]
-    for row_idx, row_data in enumerate(ml_data, 1):
-        for col_idx, cell_data in enumerate(row_data):
-            ml_table.rows[row_idx].cells[col_idx].text = cell_data
+    add_data_table(body, block_width, ml_headers, ml_data)
 
-    doc.add_paragraph()
+    add_paragraph(body)
 
     # Agent 7: Security Agent
-    doc.add_heading('Agent 7: Security Agent (NEW)', level=2)
-    doc.add_paragraph('Enterprise-grade AI security ensuring data protection, compliance, and threat detection throughout the migration process.')
-    doc.add_heading('Capabilities', level=3)
+    add_heading(body, 'Agent 7: Security Agent (NEW)', 2)
+    add_paragraph(body, 'Enterprise-grade AI security ensuring data protection, compliance, and threat detection throughout the migration process.')
+    add_heading(body, 'Capabilities', 3)
     security_caps = [
         'Data Classification - Automatic PII, PHI, PCI data detection and tagging',
         'SQL Injection Prevention - AI-powered query analysis and sanitization',
@@ -494,17 +622,11 @@ def create_word_document():
         'SIEM Integration - Splunk, DataDog, ELK Stack integration'
     ]
     for cap in security_caps:
-        doc.add_paragraph(cap, style='List Bullet')
+        add_bullet(body, cap)
 
-    doc.add_paragraph()
-    doc.add_heading('Compliance Frameworks', level=3)
-    compliance_table = doc.add_table(rows=7, cols=2)
-    compliance_table.style = 'Table Grid'
+    add_paragraph(body)
+    add_heading(body, 'Compliance Frameworks', 3)
     compliance_headers = ['Framework', 'Coverage']
-    for i, header in enumerate(compliance_headers):
-        cell = compliance_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].font.bold = True
 
     compliance_data = [
         ['GDPR', 'Data privacy, right to be forgotten, consent management'],
@@ -514,12 +636,10 @@ def create_word_document():
         ['SOC 2', 'Security, availability, processing integrity, confidentiality'],
         ['CCPA', 'California consumer privacy rights, data deletion']
     ]
-    for row_idx, row_data in enumerate(compliance_data, 1):
-        for col_idx, cell_data in enumerate(row_data):
-            compliance_table.rows[row_idx].cells[col_idx].text = cell_data
+    add_data_table(body, block_width, compliance_headers, compliance_data)
 
-    doc.add_paragraph()
-    doc.add_heading('Security Architecture', level=3)
+    add_paragraph(body)
+    add_heading(body, 'Security Architecture', 3)
     security_arch = [
         'Zero Trust Model - Verify every request, assume breach',
         'End-to-End Encryption - TLS 1.3, AES-256 encryption',
@@ -527,14 +647,14 @@ def create_word_document():
         'Network Security - VPC isolation, private endpoints, WAF protection'
     ]
     for arch in security_arch:
-        doc.add_paragraph(arch, style='List Bullet')
+        add_bullet(body, arch)
 
-    doc.add_paragraph()
+    add_paragraph(body)
 
     # Agent 8: DataPrep AI Agent
-    doc.add_heading('Agent 8: DataPrep AI Agent (NEW)', level=2)
-    doc.add_paragraph('Intelligent data preparation and cleaning for analytics and ML workloads. Available as migration add-on or standalone product.')
-    doc.add_heading('Capabilities', level=3)
+    add_heading(body, 'Agent 8: DataPrep AI Agent (NEW)', 2)
+    add_paragraph(body, 'Intelligent data preparation and cleaning for analytics and ML workloads. Available as migration add-on or standalone product.')
+    add_heading(body, 'Capabilities', 3)
     dataprep_caps = [
         'Automated Data Profiling - Comprehensive column analysis with statistics and patterns',
         'Intelligent Null Handling - Smart imputation strategies (mean, median, mode, predictive)',
@@ -546,35 +666,27 @@ def create_word_document():
         'ML-Ready Output - Prepare data for Snowflake, Databricks, BigQuery, Redshift'
     ]
     for cap in dataprep_caps:
-        doc.add_paragraph(cap, style='List Bullet')
+        add_bullet(body, cap)
 
     # DataPrep Pricing
-    doc.add_paragraph()
-    doc.add_heading('DataPrep AI Pricing (Hybrid Model)', level=3)
-    doc.add_paragraph('Available as migration add-on OR standalone product:')
+    add_paragraph(body)
+    add_heading(body, 'DataPrep AI Pricing (Hybrid Model)', 3)
+    add_paragraph(body, 'Available as migration add-on OR standalone product:')
 
-    dataprep_table = doc.add_table(rows=3, cols=3)
-    dataprep_table.style = 'Table Grid'
     dataprep_headers = ['Option', 'Price', 'Best For']
-    for i, header in enumerate(dataprep_headers):
-        cell = dataprep_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].font.bold = True
 
     dataprep_data = [
         ['Migration Add-on', '$999/month', 'Customers migrating MSSQL to dbt'],
         ['Standalone Product', '$1,999/month', 'Data teams needing prep without migration']
     ]
-    for row_idx, row_data in enumerate(dataprep_data, 1):
-        for col_idx, cell_data in enumerate(row_data):
-            dataprep_table.rows[row_idx].cells[col_idx].text = cell_data
+    add_data_table(body, block_width, dataprep_headers, dataprep_data)
 
-    doc.add_paragraph()
+    add_paragraph(body)
 
-    doc.add_page_break()
+    add_page_break(body)
 
     # ===== TARGET MARKETS =====
-    doc.add_heading('Target Market & Customer Niches', level=1)
+    add_heading(body, 'Target Market & Customer Niches', 1)
 
     markets = [
         {
@@ -634,110 +746,48 @@ def create_word_document():
     ]
 
     for market in markets:
-        doc.add_heading(market['name'], level=2)
-        doc.add_paragraph(f"Profile: {market['profile']}")
-        doc.add_paragraph('Pain Points:')
+        add_heading(body, market['name'], 2)
+        add_paragraph(body, f"Profile: {market['profile']}")
+        add_paragraph(body, 'Pain Points:')
         for point in market['pain_points']:
-            doc.add_paragraph(point, style='List Bullet')
-        doc.add_paragraph(f"Value Proposition: {market['value_prop']}")
-        doc.add_paragraph(f"Company Size: {market['size']}")
-        doc.add_paragraph(f"Budget Range: {market['budget']}")
-        doc.add_paragraph()
+            add_bullet(body, point)
+        add_paragraph(body, f"Value Proposition: {market['value_prop']}")
+        add_paragraph(body, f"Company Size: {market['size']}")
+        add_paragraph(body, f"Budget Range: {market['budget']}")
+        add_paragraph(body)
 
-    doc.add_page_break()
+    add_page_break(body)
 
     # ===== PRICING =====
-    doc.add_heading('Pricing Structure', level=1)
+    add_heading(body, 'Pricing Structure', 1)
 
-    plans = [
-        {
-            'name': 'Starter Plan - $499/month',
-            'best_for': 'Small businesses, startups, pilot projects',
-            'features': [
-                'Up to 25 database tables',
-                '1 MSSQL connection',
-                'Migration Agent (basic)',
-                'Email support',
-                '100GB data transfer/month',
-                'Basic documentation generation'
-            ]
-        },
-        {
-            'name': 'Professional Plan - $1,499/month',
-            'best_for': 'Mid-size companies, growing teams',
-            'features': [
-                'Up to 100 database tables',
-                '5 MSSQL connections',
-                'Migration Agent (full)',
-                'Customer Support Agent',
-                'Priority email & chat support',
-                '500GB data transfer/month',
-                'Advanced documentation',
-                'API access',
-                'Slack integration'
-            ]
-        },
-        {
-            'name': 'Enterprise Plan - $4,999/month',
-            'best_for': 'Large enterprises, complex migrations',
-            'features': [
-                'Unlimited database tables',
-                'Unlimited MSSQL connections',
-                'All seven AI Agents (Migration, Support, BI, Data Quality, Documentation, Security, ML)',
-                '24/7 dedicated support',
-                'Unlimited data transfer',
-                'Custom integrations',
-                'SSO/SAML authentication',
-                'Dedicated success manager',
-                'SLA guarantees (99.9% uptime)',
-                'On-premise deployment option',
-                'Custom training sessions',
-                'ML Fine-Tuning credits included'
-            ]
-        }
-    ]
-
-    for plan in plans:
-        doc.add_heading(plan['name'], level=2)
-        doc.add_paragraph(f"Best for: {plan['best_for']}")
-        doc.add_paragraph('Includes:')
-        for feature in plan['features']:
-            doc.add_paragraph(feature, style='List Bullet')
-        doc.add_paragraph()
+    for plan in _PLANS:
+        add_heading(body, plan.name, 2)
+        add_paragraph(body, f"Best for: {plan.best_for}")
+        add_paragraph(body, 'Includes:')
+        for feature in plan.features:
+            add_bullet(body, feature)
+        add_paragraph(body)
 
-    doc.add_heading('Volume Discounts', level=2)
-    discount_table = doc.add_table(rows=4, cols=2)
-    discount_table.style = 'Table Grid'
+    add_heading(body, 'Volume Discounts', 2)
     discount_headers = ['Annual Commitment', 'Discount']
-    for i, header in enumerate(discount_headers):
-        cell = discount_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].font.bold = True
 
     discount_data = [
         ['1 year prepaid', '10% off'],
         ['2 year prepaid', '20% off'],
         ['3 year prepaid', '30% off']
     ]
-    for row_idx, row_data in enumerate(discount_data, 1):
-        for col_idx, cell_data in enumerate(row_data):
-            discount_table.rows[row_idx].cells[col_idx].text = cell_data
+    add_data_table(body, block_width, discount_headers, discount_data)
 
-    doc.add_page_break()
+    add_page_break(body)
 
     # ===== COST REDUCTION BENEFITS =====
-    doc.add_heading('Cost Reduction Benefits', level=1)
+    add_heading(body, 'Cost Reduction Benefits', 1)
 
-    doc.add_heading('Direct Cost Savings', level=2)
+    add_heading(body, 'Direct Cost Savings', 2)
 
-    doc.add_heading('1. Reduced Migration Consulting Costs', level=3)
-    cost_table = doc.add_table(rows=5, cols=2)
-    cost_table.style = 'Table Grid'
+    add_heading(body, '1. Reduced Migration Consulting Costs', 3)
     cost_headers = ['Approach', 'Cost for 100-Table Migration']
-    for i, header in enumerate(cost_headers):
-        cell = cost_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].font.bold = True
 
     cost_data = [
         ['Traditional Consulting', '$150,000 - $300,000'],
@@ -745,34 +795,19 @@ def create_word_document():
         ['DataMigrate AI', '$18,000 - $36,000'],
         ['Your Savings', '$62,000 - $264,000']
     ]
-    for row_idx, row_data in enumerate(cost_data, 1):
-        for col_idx, cell_data in enumerate(row_data):
-            cell = cost_table.rows[row_idx].cells[col_idx]
-            cell.text = cell_data
-            if row_idx == 4:  # Highlight savings row
-                cell.paragraphs[0].runs[0].font.bold = True
-                cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(34, 197, 94)  # Green
+    add_data_table(body, block_width, cost_headers, cost_data, last_row_color='22C55E')
 
-    doc.add_paragraph()
+    add_paragraph(body)
 
-    doc.add_heading('2. Reduced Labor Costs', level=3)
-    doc.add_paragraph(
+    add_heading(body, '2. Reduced Labor Costs', 3)
+    add_paragraph(body,
         'Traditional migrations require 400-800 hours of engineering time. '
         'DataMigrate AI reduces this to 22-44 hours.'
     )
-    doc.add_paragraph(
-        'At $100/hour average, this represents $37,800 - $75,600 in labor savings.',
-        style='List Bullet'
-    )
+    add_bullet(body, 'At $100/hour average, this represents $37,800 - $75,600 in labor savings.')
 
-    doc.add_heading('3. Total Cost of Ownership (3-Year)', level=3)
-    tco_table = doc.add_table(rows=6, cols=3)
-    tco_table.style = 'Table Grid'
+    add_heading(body, '3. Total Cost of Ownership (3-Year)', 3)
     tco_headers = ['Cost Category', 'Traditional', 'DataMigrate AI']
-    for i, header in enumerate(tco_headers):
-        cell = tco_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].font.bold = True
 
     tco_data = [
         ['Initial Migration', '$200,000', '$36,000'],
@@ -781,28 +816,23 @@ def create_word_document():
         ['Error Remediation', '$50,000', '$5,000'],
         ['3-Year Total', '$460,000', '$100,000']
     ]
-    for row_idx, row_data in enumerate(tco_data, 1):
-        for col_idx, cell_data in enumerate(row_data):
-            cell = tco_table.rows[row_idx].cells[col_idx]
-            cell.text = cell_data
-            if row_idx == 5:  # Highlight total row
-                cell.paragraphs[0].runs[0].font.bold = True
+    add_data_table(body, block_width, tco_headers, tco_data, bold_last_row=True)
 
-    doc.add_paragraph()
-    savings_para = doc.add_paragraph()
+    add_paragraph(body)
+    savings_para = add_paragraph(body)
     run = savings_para.add_run('Total Savings: $360,000 (78%)')
     run.font.bold = True
     run.font.size = Pt(14)
     run.font.color.rgb = RGBColor(34, 197, 94)
 
-    doc.add_page_break()
+    add_page_break(body)
 
     # ===== VALUE PROPOSITION =====
-    doc.add_heading('Sales Benefits & Value Proposition', level=1)
+    add_heading(body, 'Sales Benefits & Value Proposition', 1)
 
-    doc.add_heading('For C-Suite Executives', level=2)
+    add_heading(body, 'For C-Suite Executives', 2)
 
-    doc.add_heading('CFO Value Proposition', level=3)
+    add_heading(body, 'CFO Value Proposition', 3)
     cfo_points = [
         '70-80% cost reduction vs. traditional migration approaches',
         'Predictable monthly costs with subscription model',
@@ -810,9 +840,9 @@ def create_word_document():
         'Reduced risk - AI validation catches errors before production'
     ]
     for point in cfo_points:
-        doc.add_paragraph(point, style='List Bullet')
+        add_bullet(body, point)
 
-    doc.add_heading('CTO Value Proposition', level=3)
+    add_heading(body, 'CTO Value Proposition', 3)
     cto_points = [
         'Modern architecture - dbt is the industry standard',
         'Scalable solution - handles enterprise workloads',
@@ -820,9 +850,9 @@ def create_word_document():
         'Future-proof - continuous AI improvements included'
     ]
     for point in cto_points:
-        doc.add_paragraph(point, style='List Bullet')
+        add_bullet(body, point)
 
-    doc.add_heading('CEO Value Proposition', level=3)
+    add_heading(body, 'CEO Value Proposition', 3)
     ceo_points = [
         'Competitive advantage - faster data-driven decisions',
         'Innovation enabler - unlocks modern analytics capabilities',
@@ -830,9 +860,9 @@ def create_word_document():
         'Growth foundation - scalable data infrastructure'
     ]
     for point in ceo_points:
-        doc.add_paragraph(point, style='List Bullet')
+        add_bullet(body, point)
 
-    doc.add_heading('Key Differentiators', level=2)
+    add_heading(body, 'Key Differentiators', 2)
     differentiators = [
         ('Speed', 'What takes months with traditional tools takes weeks with DataMigrate AI'),
         ('Accuracy', 'AI-powered validation catches 95% of migration errors before they reach production'),
@@ -841,41 +871,30 @@ def create_word_document():
         ('Intelligence', 'Not just migration - unlock business insights from your data')
     ]
     for name, desc in differentiators:
-        para = doc.add_paragraph()
-        run = para.add_run(f'{name}: ')
-        run.font.bold = True
-        para.add_run(desc)
-
-    doc.add_heading('ROI Summary', level=2)
-    roi_table = doc.add_table(rows=3, cols=3)
-    roi_table.style = 'Table Grid'
+        add_bold_label_paragraph(body, f'{name}: ', desc)
+
+    add_heading(body, 'ROI Summary', 2)
     roi_headers = ['Investment', 'Year 1 Value', '3-Year Value']
-    for i, header in enumerate(roi_headers):
-        cell = roi_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].font.bold = True
 
     roi_data = [
         ['Professional Plan ($18K/yr)', '$100K+', '$350K+'],
         ['Enterprise Plan ($60K/yr)', '$300K+', '$1M+']
     ]
-    for row_idx, row_data in enumerate(roi_data, 1):
-        for col_idx, cell_data in enumerate(row_data):
-            roi_table.rows[row_idx].cells[col_idx].text = cell_data
+    add_data_table(body, block_width, roi_headers, roi_data)
 
-    doc.add_paragraph()
-    roi_para = doc.add_paragraph()
+    add_paragraph(body)
+    roi_para = add_paragraph(body)
     run = roi_para.add_run('Average ROI: 400-600% in Year 1')
     run.font.bold = True
     run.font.size = Pt(14)
     run.font.color.rgb = RGBColor(79, 70, 229)
 
-    doc.add_page_break()
+    add_page_break(body)
 
     # ===== MVP DEVELOPMENT ROADMAP =====
-    doc.add_heading('MVP Development Roadmap', level=1)
+    add_heading(body, 'MVP Development Roadmap', 1)
 
-    doc.add_heading('Phase 1: Core Platform (Complete)', level=2)
+    add_heading(body, 'Phase 1: Core Platform (Complete)', 2)
     phase1_items = [
         'MSSQL Connector - Secure database connection with Windows/SQL auth ✓',
         'Schema Extractor - Automated table, column, and relationship discovery ✓',
@@ -884,10 +903,10 @@ def create_word_document():
         'API Backend - REST API for all operations ✓'
     ]
     for item in phase1_items:
-        doc.add_paragraph(item, style='List Bullet')
+        add_bullet(body, item)
 
-    doc.add_heading('Phase 2: Competitive Parity Features', level=2)
-    doc.add_paragraph('Priority: P0 - Required to Compete with Datafold')
+    add_heading(body, 'Phase 2: Competitive Parity Features', 2)
+    add_paragraph(body, 'Priority: P0 - Required to Compete with Datafold')
     phase2_items = [
         'Data Validation Engine - Cross-database row-level comparison',
         'Stored Procedure Converter - T-SQL to dbt macro transformation',
@@ -895,20 +914,20 @@ def create_word_document():
         'Schema Diff Tool - Visual comparison of source vs target'
     ]
     for item in phase2_items:
-        doc.add_paragraph(item, style='List Bullet')
+        add_bullet(body, item)
 
-    doc.add_heading('Phase 3: AI Agent Expansion', level=2)
-    doc.add_paragraph('Priority: P1 - Competitive Differentiation')
+    add_heading(body, 'Phase 3: AI Agent Expansion', 2)
+    add_paragraph(body, 'Priority: P1 - Competitive Differentiation')
     phase3_items = [
         'Data Quality Agent - Anomaly detection, quality scoring, continuous monitoring',
         'Documentation Agent - RAG-powered docs, business glossary, lineage visualization',
         'Customer Support Agent - Ticket routing, instant responses, troubleshooting'
     ]
     for item in phase3_items:
-        doc.add_paragraph(item, style='List Bullet')
+        add_bullet(body, item)
 
-    doc.add_heading('Phase 4: ML & Advanced Features', level=2)
-    doc.add_paragraph('Priority: P2 - Market Leadership')
+    add_heading(body, 'Phase 4: ML & Advanced Features', 2)
+    add_paragraph(body, 'Priority: P2 - Market Leadership')
     phase4_items = [
         'ML Fine-Tuning Agent - Custom model training on customer data',
         'SSIS Package Importer - Convert SSIS packages to dbt pipelines',
@@ -917,37 +936,29 @@ def create_word_document():
         'Self-Service Portal - White-label for consulting partners'
     ]
     for item in phase4_items:
-        doc.add_paragraph(item, style='List Bullet')
+        add_bullet(body, item)
 
-    doc.add_heading('Development Milestones', level=2)
+    add_heading(body, 'Development Milestones', 2)
 
     # Milestone table
-    milestone_table = doc.add_table(rows=4, cols=3)
-    milestone_table.style = 'Table Grid'
     milestone_headers = ['Milestone', 'Goal', 'Key Deliverables']
-    for i, header in enumerate(milestone_headers):
-        cell = milestone_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].font.bold = True
 
     milestone_data = [
         ['MVP Launch', 'First paying customers', 'Core migration, validation, reconciliation'],
         ['Enterprise Ready', 'Land enterprise customers', 'All agents, SOC2, SSO/SAML'],
         ['AI Platform', 'Market differentiation', 'ML Fine-Tuning, industry templates']
     ]
-    for row_idx, row_data in enumerate(milestone_data, 1):
-        for col_idx, cell_data in enumerate(row_data):
-            milestone_table.rows[row_idx].cells[col_idx].text = cell_data
+    add_data_table(body, block_width, milestone_headers, milestone_data)
 
-    doc.add_page_break()
+    add_page_break(body)
 
     # ===== NEXT STEPS =====
-    doc.add_heading('Next Steps', level=1)
+    add_heading(body, 'Next Steps', 1)
 
-    doc.add_heading('Ready to Transform Your Data Infrastructure?', level=2)
+    add_heading(body, 'Ready to Transform Your Data Infrastructure?', 2)
 
-    doc.add_heading('Option 1: Free Assessment', level=3)
-    doc.add_paragraph('Schedule a complimentary migration assessment to understand:')
+    add_heading(body, 'Option 1: Free Assessment', 3)
+    add_paragraph(body, 'Schedule a complimentary migration assessment to understand:')
     assessment_points = [
         'Current database complexity',
         'Estimated migration timeline',
@@ -955,20 +966,20 @@ def create_word_document():
         'Recommended plan'
     ]
     for point in assessment_points:
-        doc.add_paragraph(point, style='List Bullet')
+        add_bullet(body, point)
 
-    doc.add_heading('Option 2: Live Demo', level=3)
-    doc.add_paragraph('See DataMigrate AI in action with a personalized demo:')
+    add_heading(body, 'Option 2: Live Demo', 3)
+    add_paragraph(body, 'See DataMigrate AI in action with a personalized demo:')
     demo_points = [
         '30-minute overview',
         'Your use case discussion',
         'Q&A with product experts'
     ]
     for point in demo_points:
-        doc.add_paragraph(point, style='List Bullet')
+        add_bullet(body, point)
 
-    doc.add_heading('Option 3: Pilot Program', level=3)
-    doc.add_paragraph('Start with a low-risk pilot:')
+    add_heading(body, 'Option 3: Pilot Program', 3)
+    add_paragraph(body, 'Start with a low-risk pilot:')
     pilot_points = [
         'Migrate 5-10 tables',
         'Full platform access',
@@ -976,42 +987,42 @@ def create_word_document():
         'No long-term commitment'
     ]
     for point in pilot_points:
-        doc.add_paragraph(point, style='List Bullet')
+        add_bullet(body, point)
 
-    doc.add_paragraph()
+    add_paragraph(body)
 
     # Contact info
-    doc.add_heading('Contact Information', level=2)
-    contact_info = [
-        ('Sales Inquiries:', 'sales@datamigrate.ai'),
-        ('Technical Questions:', 'support@datamigrate.ai'),
-        ('Partnership Opportunities:', 'partners@datamigrate.ai')
-    ]
-    for label, email in contact_info:
-        para = doc.add_paragraph()
-        run = para.add_run(f'{label} ')
-        run.font.bold = True
-        para.add_run(email)
+    add_heading(body, 'Contact Information', 2)
+    for label, email in _CONTACT_INFO:
+        add_bold_label_paragraph(body, f'{label} ', email)
 
-    doc.add_paragraph()
-    doc.add_paragraph()
+    add_paragraph(body)
+    add_paragraph(body)
 
     # Footer
-    footer = doc.add_paragraph()
+    footer = add_paragraph(body)
     footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = footer.add_run('DataMigrate AI - Intelligent Data Migration for the Modern Enterprise')
     run.font.italic = True
     run.font.color.rgb = RGBColor(107, 114, 128)
 
-    copyright_para = doc.add_paragraph()
+    copyright_para = add_paragraph(body)
     copyright_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = copyright_para.add_run('© 2025 DataMigrate AI. All rights reserved.')
     run.font.size = Pt(10)
     run.font.color.rgb = RGBColor(156, 163, 175)
 
+    # Attach everything built above ahead of the section properties in one go
+    doc_body = doc.element.body
+    sect_pr = doc_body.sectPr
+    doc_body.remove(sect_pr)
+    doc_body.extend(body)
+    doc_body.append(sect_pr)
+
     # Save the document
-    output_path = Path(__file__).parent.parent / 'docs' / 'DATAMIGRATE_AI_SALES_DOCUMENT_v2.docx'
     doc.save(output_path)
+    _BUILD_CACHE_DIR.mkdir(exist_ok=True)
+    shutil.copyfile(output_path, cached_path)
     print(f'Word document created: {output_path}')
     return output_path
 
@@ -2,6 +2,7 @@
 Script to generate Security Documentation in Word (.docx) and PDF formats
 """
 
+import docx
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -9,16 +10,64 @@ from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
+from lxml import etree
+from copy import deepcopy
+import glob
+import hashlib
+import io
 import os
+import shutil
+import zipfile
 from datetime import datetime
 
+# Clark-notation names resolved once at import instead of per element
+_QN_FILL = qn('w:fill')
+_QN_VAL = qn('w:val')
+_QN_P = qn('w:p')
+_QN_R = qn('w:r')
+_QN_T = qn('w:t')
+_QN_PPR = qn('w:pPr')
+_QN_PSTYLE = qn('w:pStyle')
+_QN_TR = qn('w:tr')
+_QN_TC = qn('w:tc')
+_QN_TCPR = qn('w:tcPr')
+_QN_TCW = qn('w:tcW')
+_QN_TYPE = qn('w:type')
+_QN_W = qn('w:w')
+_QN_GRID_COL = qn('w:gridCol')
+
+# One prebuilt <w:shd> per fill color, cloned into each painted cell
+_SHD_CACHE = {}
+
+# Shared color and font-size values
+_WHITE = RGBColor(255, 255, 255)
+_PT9 = Pt(9)
+_PT10 = Pt(10)
+_PT11 = Pt(11)
+_PT12 = Pt(12)
+
+def _run_properties(bold=False, color=None, size=None):
+    """Build a <w:rPr> element"""
+    rPr = OxmlElement('w:rPr')
+    if bold:
+        rPr.append(OxmlElement('w:b'))
+    if color is not None:
+        rPr.append(OxmlElement('w:color', {_QN_VAL: str(color)}))
+    if size is not None:
+        rPr.append(OxmlElement('w:sz', {_QN_VAL: str(round(size.pt * 2))}))
+    return rPr
+
+# Table run properties: bold white 10pt header, 9pt body
+_RPR_HEADER = _run_properties(bold=True, color=_WHITE, size=_PT10)
+_RPR_BODY = _run_properties(size=_PT9)
+
 def set_cell_shading(cell, fill_color):
     """Set cell background color"""
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    shd = OxmlElement('w:shd')
-    shd.set(qn('w:fill'), fill_color)
-    tcPr.append(shd)
+    tmpl = _SHD_CACHE.get(fill_color)
+    if tmpl is None:
+        tmpl = OxmlElement('w:shd', {_QN_FILL: fill_color})
+        _SHD_CACHE[fill_color] = tmpl
+    cell._tc.get_or_add_tcPr().append(deepcopy(tmpl))
 
 def add_table_with_header(doc, headers, rows, header_color='2E5090'):
     """Add a formatted table with colored header"""
@@ -30,31 +79,158 @@ def add_table_with_header(doc, headers, rows, header_color='2E5090'):
     for idx, header in enumerate(headers):
         header_cells[idx].text = header
         set_cell_shading(header_cells[idx], header_color)
-        for paragraph in header_cells[idx].paragraphs:
-            for run in paragraph.runs:
-                run.font.bold = True
-                run.font.color.rgb = RGBColor(255, 255, 255)
-                run.font.size = Pt(10)
+        # cell.text leaves exactly one paragraph holding one run
+        header_cells[idx].paragraphs[0].runs[0]._r.insert(0, deepcopy(_RPR_HEADER))
 
-    # Data rows
+    # Data rows, built as a raw <w:tr> subtree instead of add_row()/cell.text
+    tbl = table._tbl
+    widths = [grid_col.get(_QN_W) for grid_col in tbl.tblGrid.iterchildren(_QN_GRID_COL)]
     for row_data in rows:
-        row = table.add_row()
-        for idx, cell_text in enumerate(row_data):
-            row.cells[idx].text = str(cell_text)
-            for paragraph in row.cells[idx].paragraphs:
-                for run in paragraph.runs:
-                    run.font.size = Pt(9)
+        tr = etree.SubElement(tbl, _QN_TR)
+        for width, cell_text in zip(widths, row_data):
+            tc = etree.SubElement(tr, _QN_TC)
+            tcPr = etree.SubElement(tc, _QN_TCPR)
+            etree.SubElement(tcPr, _QN_TCW, {_QN_TYPE: 'dxa', _QN_W: width})
+            r = etree.SubElement(etree.SubElement(tc, _QN_P), _QN_R)
+            r.append(deepcopy(_RPR_BODY))
+            etree.SubElement(r, _QN_T).text = str(cell_text)
 
     return table
 
-def create_security_document():
-    doc = Document()
-
-    # Set up styles
-    style = doc.styles['Normal']
-    style.font.name = 'Calibri'
-    style.font.size = Pt(11)
-
+def _restart_numbered_lists(doc):
+    """Give each run of consecutive List Number paragraphs its own <w:num> so every list starts at 1"""
+    style = doc.styles['List Number']
+    numbering = doc.part.numbering_part.element
+    abstract_id = numbering.num_having_numId(style.element.pPr.numPr.numId.val).abstractNumId.val
+    num_id = None
+    for child in doc.element.body.iterchildren():
+        if child.tag == _QN_P and child.style == style.style_id:
+            if num_id is None:
+                num = numbering.add_num(abstract_id)
+                num.add_lvlOverride(ilvl=0).add_startOverride(1)
+                num_id = num.numId
+            numPr = child.get_or_add_pPr().get_or_add_numPr()
+            numPr.get_or_add_ilvl().val = 0
+            numPr.get_or_add_numId().val = num_id
+        else:
+            num_id = None
+
+def _fast_bullets(doc, items, style_id):
+    """Append one styled single-run paragraph per item, ahead of the section properties"""
+    sectPr = doc.element.body.sectPr
+    for text in items:
+        p = OxmlElement('w:p')
+        etree.SubElement(etree.SubElement(p, _QN_PPR), _QN_PSTYLE, {_QN_VAL: style_id})
+        etree.SubElement(etree.SubElement(p, _QN_R), _QN_T).text = text
+        sectPr.addprevious(p)
+
+# Static table payloads and their header rows, keyed by table
+_TABLES = {
+    'layers': (
+        ('Layer 1: Network Security', 'CORS Policy, HTTPS/TLS Encryption, Rate Limiting'),
+        ('Layer 2: Guardian Security Agent', 'Request validation, Pattern detection, Real-time threat blocking'),
+        ('Layer 3: Authentication & Authorization', 'JWT Token validation, Role-based access control, Organization isolation'),
+        ('Layer 4: Application Security', 'Input validation, Parameterized queries, Secure credential handling'),
+        ('Layer 5: Data Security', 'AES-256-GCM encryption, Bcrypt hashing, Audit logging'),
+    ),
+    'components': (
+        ('Encryption Service', 'AES-256-GCM', 'Encrypts database credentials at rest'),
+        ('Password Hashing', 'Bcrypt (cost factor 10)', 'Secure user password storage'),
+        ('Authentication', 'JWT (HS256)', 'Stateless session management'),
+        ('Security Agent', 'Guardian', 'Real-time threat detection and blocking'),
+        ('Pattern Detector', 'Regex-based', 'SQL injection, XSS, command injection detection'),
+        ('Rate Limiter', 'Sliding Window', 'DDoS and abuse prevention'),
+        ('Audit Logger', 'PostgreSQL-backed', 'Security event tracking'),
+    ),
+    'roles': (
+        ('User', 'CRUD on own resources, view own organization data'),
+        ('Admin', 'All user permissions + user management, security logs'),
+        ('Super Admin', 'Platform-wide administration'),
+    ),
+    'specs': (
+        ('Algorithm', 'AES-256-GCM'),
+        ('Key Size', '256 bits (32 bytes)'),
+        ('Nonce Size', '96 bits (12 bytes)'),
+        ('Authentication Tag', '128 bits (16 bytes)'),
+        ('Key Storage', 'Environment variable (base64-encoded)'),
+    ),
+    'sql_patterns': (
+        ('SQL Statements', 'SELECT...FROM, INSERT INTO, DROP TABLE'),
+        ('UNION Injection', 'UNION SELECT'),
+        ('Boolean Injection', 'OR 1=1, AND 1=1'),
+        ('Comment Injection', '--, /* */'),
+        ('Time-Based', 'SLEEP(), WAITFOR DELAY, BENCHMARK()'),
+        ('System Access', 'xp_cmdshell, INFORMATION_SCHEMA'),
+    ),
+    'xss_patterns': (
+        ('Script Tags', '<script>, <script src=...>'),
+        ('Event Handlers', 'onclick=, onload=, onerror='),
+        ('JavaScript Protocol', 'javascript:'),
+        ('Dangerous Elements', '<iframe>, <embed>, <object>'),
+        ('Data URIs', 'data:text/html'),
+        ('SVG Attacks', '<svg onload=...>'),
+    ),
+    'prompt_patterns': (
+        ('Instruction Override', 'ignore previous instructions'),
+        ('Role Change', 'you are now, act as if you'),
+        ('System Reveal', 'reveal your system prompt'),
+        ('Marker Injection', 'HUMAN:, ASSISTANT:, <|im_start|>'),
+    ),
+    'limits': (
+        ('Per Second (Burst)', '50 requests', 'Prevent rapid-fire attacks'),
+        ('Per Minute', '300 requests', 'Normal operation limit'),
+        ('Per Hour', '3,000 requests', 'Sustained abuse prevention'),
+    ),
+    'severities': (
+        ('Critical', 'Immediate threat', 'Prompt injection, command injection'),
+        ('High', 'Serious security issue', 'SQL injection, XSS attempts'),
+        ('Warning', 'Potential issue', 'Rate limit exceeded, failed auth'),
+        ('Info', 'Normal operation', 'Successful requests'),
+    ),
+    'standards': (
+        ('OWASP Top 10', 'SQL Injection, XSS, Auth, Sensitive Data, Security Misconfiguration'),
+        ('SOC 2 Type II', 'Access Controls, Encryption, Audit Logging, Monitoring'),
+        ('GDPR', 'Data Protection, Access Controls, Audit Trails'),
+        ('ISO 27001', 'Information Security Management'),
+    ),
+    'risks': (
+        ('SQL Injection', 'Low', 'Critical', 'Pattern detection, parameterized queries', 'Low'),
+        ('XSS Attack', 'Low', 'High', 'Input sanitization, CSP headers', 'Low'),
+        ('Credential Theft', 'Low', 'Critical', 'AES-256 encryption, bcrypt hashing', 'Low'),
+        ('Brute Force Attack', 'Medium', 'Medium', 'Rate limiting, account lockout', 'Low'),
+        ('DDoS Attack', 'Medium', 'High', 'Rate limiting, CDN integration', 'Medium'),
+        ('Session Hijacking', 'Low', 'High', 'Short-lived JWT, HTTPS only', 'Low'),
+        ('Prompt Injection', 'Medium', 'Medium', 'Pattern detection, input validation', 'Low'),
+        ('Data Breach', 'Low', 'Critical', 'Encryption, access controls, auditing', 'Low'),
+    ),
+    'incidents': (
+        ('P1 - Critical', 'Active breach, data exposure', 'Immediate', 'Data leak, successful attack'),
+        ('P2 - High', 'Active attack attempt', '1 hour', 'Multiple blocked attacks'),
+        ('P3 - Medium', 'Security anomaly', '4 hours', 'Unusual access patterns'),
+        ('P4 - Low', 'Minor security event', '24 hours', 'Failed login attempts'),
+    ),
+}
+
+_TABLE_HEADERS = {
+    'layers': ('Security Layer', 'Components'),
+    'components': ('Component', 'Technology', 'Purpose'),
+    'roles': ('Role', 'Permissions'),
+    'specs': ('Parameter', 'Value'),
+    'sql_patterns': ('Pattern Type', 'Examples Blocked'),
+    'xss_patterns': ('Pattern Type', 'Examples Blocked'),
+    'prompt_patterns': ('Pattern Type', 'Examples Blocked'),
+    'limits': ('Window', 'Limit', 'Purpose'),
+    'severities': ('Level', 'Description', 'Examples'),
+    'standards': ('Standard', 'Coverage'),
+    'risks': ('Risk', 'Likelihood', 'Impact', 'Mitigation', 'Residual'),
+    'incidents': ('Level', 'Description', 'Response Time', 'Examples'),
+}
+
+# Cover line carrying the build date; _dated_runs() relies on it for re-dating cached builds
+_COVER_INFO_TMPL = 'Version: 1.0 | Date: {} | Classification: Confidential'
+
+def _build_cover(doc, now_str):
+    """Title page and document info"""
     # Title
     title = doc.add_heading('DataMigrate AI', level=0)
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
@@ -65,33 +241,38 @@ def create_security_document():
     # Document info
     info = doc.add_paragraph()
     info.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    info.add_run(f'Version: 1.0 | Date: {datetime.now().strftime("%B %Y")} | Classification: Confidential').italic = True
+    info.add_run(_COVER_INFO_TMPL.format(now_str)).italic = True
 
     doc.add_paragraph()
     doc.add_page_break()
 
-    # Table of Contents
+def _build_toc(doc):
+    """Table of contents"""
+    number_id = doc.styles['List Number'].style_id
+
     doc.add_heading('Table of Contents', level=1)
     toc_items = [
-        '1. Executive Summary',
-        '2. Security Architecture Overview',
-        '3. Authentication & Authorization',
-        '4. Data Encryption',
-        '5. Input Validation & Sanitization',
-        '6. Rate Limiting & DDoS Protection',
-        '7. Audit Logging & Monitoring',
-        '8. Network Security',
-        '9. Compliance & Standards',
-        '10. Risk Assessment',
-        '11. Incident Response',
-        '12. Security Best Practices for Clients'
-    ]
-    for item in toc_items:
-        doc.add_paragraph(item, style='List Number')
+        'Executive Summary',
+        'Security Architecture Overview',
+        'Authentication & Authorization',
+        'Data Encryption',
+        'Input Validation & Sanitization',
+        'Rate Limiting & DDoS Protection',
+        'Audit Logging & Monitoring',
+        'Network Security',
+        'Compliance & Standards',
+        'Risk Assessment',
+        'Incident Response',
+        'Security Best Practices for Clients'
+    ]
+    _fast_bullets(doc, toc_items, number_id)
 
     doc.add_page_break()
 
-    # 1. Executive Summary
+def _build_section_1(doc):
+    """1. Executive Summary"""
+    bullet_id = doc.styles['List Bullet'].style_id
+
     doc.add_heading('1. Executive Summary', level=1)
     doc.add_paragraph(
         'DataMigrate AI is designed with security as a foundational principle. Our platform facilitates '
@@ -110,12 +291,12 @@ def create_security_document():
         'Rate Limiting with sliding window algorithm to prevent abuse',
         'Input Validation with pattern detection for SQL injection, XSS, and prompt injection attacks'
     ]
-    for h in highlights:
-        doc.add_paragraph(h, style='List Bullet')
+    _fast_bullets(doc, highlights, bullet_id)
 
     doc.add_page_break()
 
-    # 2. Security Architecture
+def _build_section_2(doc):
+    """2. Security Architecture"""
     doc.add_heading('2. Security Architecture Overview', level=1)
 
     doc.add_heading('2.1 Defense in Depth', level=2)
@@ -123,32 +304,20 @@ def create_security_document():
         'DataMigrate AI implements a multi-layered security architecture with five distinct security layers:'
     )
 
-    layers = [
-        ('Layer 1: Network Security', 'CORS Policy, HTTPS/TLS Encryption, Rate Limiting'),
-        ('Layer 2: Guardian Security Agent', 'Request validation, Pattern detection, Real-time threat blocking'),
-        ('Layer 3: Authentication & Authorization', 'JWT Token validation, Role-based access control, Organization isolation'),
-        ('Layer 4: Application Security', 'Input validation, Parameterized queries, Secure credential handling'),
-        ('Layer 5: Data Security', 'AES-256-GCM encryption, Bcrypt hashing, Audit logging')
-    ]
-    add_table_with_header(doc, ['Security Layer', 'Components'], layers)
+    add_table_with_header(doc, _TABLE_HEADERS['layers'], _TABLES['layers'])
 
     doc.add_paragraph()
 
     doc.add_heading('2.2 Security Components', level=2)
-    components = [
-        ('Encryption Service', 'AES-256-GCM', 'Encrypts database credentials at rest'),
-        ('Password Hashing', 'Bcrypt (cost factor 10)', 'Secure user password storage'),
-        ('Authentication', 'JWT (HS256)', 'Stateless session management'),
-        ('Security Agent', 'Guardian', 'Real-time threat detection and blocking'),
-        ('Pattern Detector', 'Regex-based', 'SQL injection, XSS, command injection detection'),
-        ('Rate Limiter', 'Sliding Window', 'DDoS and abuse prevention'),
-        ('Audit Logger', 'PostgreSQL-backed', 'Security event tracking')
-    ]
-    add_table_with_header(doc, ['Component', 'Technology', 'Purpose'], components)
+    add_table_with_header(doc, _TABLE_HEADERS['components'], _TABLES['components'])
 
     doc.add_page_break()
 
-    # 3. Authentication & Authorization
+def _build_section_3(doc):
+    """3. Authentication & Authorization"""
+    bullet_id = doc.styles['List Bullet'].style_id
+    number_id = doc.styles['List Number'].style_id
+
     doc.add_heading('3. Authentication & Authorization', level=1)
 
     doc.add_heading('3.1 User Authentication', level=2)
@@ -163,17 +332,11 @@ def create_security_document():
         'Secret key stored in environment variable',
         'Token transmitted via Authorization header with Bearer scheme'
     ]
-    for f in jwt_features:
-        doc.add_paragraph(f, style='List Bullet')
+    _fast_bullets(doc, jwt_features, bullet_id)
 
     doc.add_heading('3.2 Authorization Model', level=2)
     doc.add_paragraph('Role-Based Access Control (RBAC):')
-    roles = [
-        ('User', 'CRUD on own resources, view own organization data'),
-        ('Admin', 'All user permissions + user management, security logs'),
-        ('Super Admin', 'Platform-wide administration')
-    ]
-    add_table_with_header(doc, ['Role', 'Permissions'], roles)
+    add_table_with_header(doc, _TABLE_HEADERS['roles'], _TABLES['roles'])
 
     doc.add_paragraph()
     doc.add_paragraph('Organization Isolation:', style='Heading 4')
@@ -187,12 +350,15 @@ def create_security_document():
         'Token can only be used once (marked as used after reset)',
         'Previous tokens for user are invalidated upon new request'
     ]
-    for idx, step in enumerate(reset_steps, 1):
-        doc.add_paragraph(f'{idx}. {step}')
+    _fast_bullets(doc, reset_steps, number_id)
 
     doc.add_page_break()
 
-    # 4. Data Encryption
+def _build_section_4(doc):
+    """4. Data Encryption"""
+    bullet_id = doc.styles['List Bullet'].style_id
+    number_id = doc.styles['List Number'].style_id
+
     doc.add_heading('4. Data Encryption', level=1)
 
     doc.add_heading('4.1 Encryption at Rest', level=2)
@@ -201,14 +367,7 @@ def create_security_document():
 
     doc.add_paragraph()
     doc.add_paragraph('Technical Specifications:')
-    specs = [
-        ('Algorithm', 'AES-256-GCM'),
-        ('Key Size', '256 bits (32 bytes)'),
-        ('Nonce Size', '96 bits (12 bytes)'),
-        ('Authentication Tag', '128 bits (16 bytes)'),
-        ('Key Storage', 'Environment variable (base64-encoded)')
-    ]
-    add_table_with_header(doc, ['Parameter', 'Value'], specs)
+    add_table_with_header(doc, _TABLE_HEADERS['specs'], _TABLES['specs'])
 
     doc.add_paragraph()
     doc.add_paragraph('Encryption Process:')
@@ -218,8 +377,7 @@ def create_security_document():
         'Prepend nonce to ciphertext',
         'Encode result as base64 for storage'
     ]
-    for idx, step in enumerate(enc_steps, 1):
-        doc.add_paragraph(f'{idx}. {step}')
+    _fast_bullets(doc, enc_steps, number_id)
 
     doc.add_heading('4.2 Encryption in Transit', level=2)
     doc.add_paragraph('TLS/HTTPS:')
@@ -228,18 +386,19 @@ def create_security_document():
         'TLS 1.2+ recommended',
         'Strong cipher suites enforced'
     ]
-    for f in tls_features:
-        doc.add_paragraph(f, style='List Bullet')
+    _fast_bullets(doc, tls_features, bullet_id)
 
     doc.add_heading('4.3 Sensitive Data Handling', level=2)
     doc.add_paragraph('Data Never Logged:')
     never_logged = ['Passwords', 'API keys', 'Database connection strings', 'JWT tokens', 'Credit card information']
-    for item in never_logged:
-        doc.add_paragraph(item, style='List Bullet')
+    _fast_bullets(doc, never_logged, bullet_id)
 
     doc.add_page_break()
 
-    # 5. Input Validation
+def _build_section_5(doc):
+    """5. Input Validation"""
+    bullet_id = doc.styles['List Bullet'].style_id
+
     doc.add_heading('5. Input Validation & Sanitization', level=1)
 
     doc.add_heading('5.1 Guardian Security Agent', level=2)
@@ -252,57 +411,33 @@ def create_security_document():
         'Query parameter inspection',
         'JSON schema validation'
     ]
-    for item in validation_items:
-        doc.add_paragraph(item, style='List Bullet')
+    _fast_bullets(doc, validation_items, bullet_id)
 
     doc.add_heading('5.2 Pattern Detection', level=2)
 
     doc.add_paragraph('SQL Injection Protection:', style='Heading 4')
-    sql_patterns = [
-        ('SQL Statements', 'SELECT...FROM, INSERT INTO, DROP TABLE'),
-        ('UNION Injection', 'UNION SELECT'),
-        ('Boolean Injection', 'OR 1=1, AND 1=1'),
-        ('Comment Injection', '--, /* */'),
-        ('Time-Based', 'SLEEP(), WAITFOR DELAY, BENCHMARK()'),
-        ('System Access', 'xp_cmdshell, INFORMATION_SCHEMA')
-    ]
-    add_table_with_header(doc, ['Pattern Type', 'Examples Blocked'], sql_patterns)
+    add_table_with_header(doc, _TABLE_HEADERS['sql_patterns'], _TABLES['sql_patterns'])
 
     doc.add_paragraph()
     doc.add_paragraph('XSS Protection:', style='Heading 4')
-    xss_patterns = [
-        ('Script Tags', '<script>, <script src=...>'),
-        ('Event Handlers', 'onclick=, onload=, onerror='),
-        ('JavaScript Protocol', 'javascript:'),
-        ('Dangerous Elements', '<iframe>, <embed>, <object>'),
-        ('Data URIs', 'data:text/html'),
-        ('SVG Attacks', '<svg onload=...>')
-    ]
-    add_table_with_header(doc, ['Pattern Type', 'Examples Blocked'], xss_patterns)
+    add_table_with_header(doc, _TABLE_HEADERS['xss_patterns'], _TABLES['xss_patterns'])
 
     doc.add_paragraph()
     doc.add_paragraph('Prompt Injection Protection (AI-Specific):', style='Heading 4')
-    prompt_patterns = [
-        ('Instruction Override', 'ignore previous instructions'),
-        ('Role Change', 'you are now, act as if you'),
-        ('System Reveal', 'reveal your system prompt'),
-        ('Marker Injection', 'HUMAN:, ASSISTANT:, <|im_start|>')
-    ]
-    add_table_with_header(doc, ['Pattern Type', 'Examples Blocked'], prompt_patterns)
+    add_table_with_header(doc, _TABLE_HEADERS['prompt_patterns'], _TABLES['prompt_patterns'])
 
     doc.add_page_break()
 
-    # 6. Rate Limiting
+def _build_section_6(doc):
+    """6. Rate Limiting"""
+    bullet_id = doc.styles['List Bullet'].style_id
+    number_id = doc.styles['List Number'].style_id
+
     doc.add_heading('6. Rate Limiting & DDoS Protection', level=1)
 
     doc.add_heading('6.1 Rate Limiting Configuration', level=2)
     doc.add_paragraph('Default Limits:')
-    limits = [
-        ('Per Second (Burst)', '50 requests', 'Prevent rapid-fire attacks'),
-        ('Per Minute', '300 requests', 'Normal operation limit'),
-        ('Per Hour', '3,000 requests', 'Sustained abuse prevention')
-    ]
-    add_table_with_header(doc, ['Window', 'Limit', 'Purpose'], limits)
+    add_table_with_header(doc, _TABLE_HEADERS['limits'], _TABLES['limits'])
 
     doc.add_paragraph()
     doc.add_paragraph('Blocking Behavior:')
@@ -311,8 +446,7 @@ def create_security_document():
         '5 per-minute violations result in 1 minute block',
         'Automatic cleanup of stale entries every 10 minutes'
     ]
-    for b in blocking:
-        doc.add_paragraph(b, style='List Bullet')
+    _fast_bullets(doc, blocking, bullet_id)
 
     doc.add_heading('6.2 Rate Limit Algorithm', level=2)
     doc.add_paragraph('DataMigrate AI uses a sliding window rate limiting algorithm:')
@@ -322,12 +456,14 @@ def create_security_document():
         'Apply progressively stricter limits',
         'Block repeat offenders temporarily'
     ]
-    for idx, step in enumerate(algo_steps, 1):
-        doc.add_paragraph(f'{idx}. {step}')
+    _fast_bullets(doc, algo_steps, number_id)
 
     doc.add_page_break()
 
-    # 7. Audit Logging
+def _build_section_7(doc):
+    """7. Audit Logging"""
+    bullet_id = doc.styles['List Bullet'].style_id
+
     doc.add_heading('7. Audit Logging & Monitoring', level=1)
 
     doc.add_heading('7.1 Events Logged', level=2)
@@ -339,8 +475,7 @@ def create_security_document():
         'Suspicious pattern detections',
         'Blocked requests'
     ]
-    for e in sec_events:
-        doc.add_paragraph(e, style='List Bullet')
+    _fast_bullets(doc, sec_events, bullet_id)
 
     doc.add_paragraph()
     doc.add_paragraph('Audit Events:')
@@ -350,17 +485,10 @@ def create_security_document():
         'Migration operations',
         'API key management'
     ]
-    for e in audit_events:
-        doc.add_paragraph(e, style='List Bullet')
+    _fast_bullets(doc, audit_events, bullet_id)
 
     doc.add_heading('7.2 Severity Levels', level=2)
-    severities = [
-        ('Critical', 'Immediate threat', 'Prompt injection, command injection'),
-        ('High', 'Serious security issue', 'SQL injection, XSS attempts'),
-        ('Warning', 'Potential issue', 'Rate limit exceeded, failed auth'),
-        ('Info', 'Normal operation', 'Successful requests')
-    ]
-    add_table_with_header(doc, ['Level', 'Description', 'Examples'], severities)
+    add_table_with_header(doc, _TABLE_HEADERS['severities'], _TABLES['severities'])
 
     doc.add_heading('7.3 Monitoring Endpoints', level=2)
     endpoints = [
@@ -369,12 +497,14 @@ def create_security_document():
         'GET /api/v1/security/dashboard - Security dashboard data',
         'GET /metrics - Prometheus metrics endpoint'
     ]
-    for e in endpoints:
-        doc.add_paragraph(e, style='List Bullet')
+    _fast_bullets(doc, endpoints, bullet_id)
 
     doc.add_page_break()
 
-    # 8. Network Security
+def _build_section_8(doc):
+    """8. Network Security"""
+    bullet_id = doc.styles['List Bullet'].style_id
+
     doc.add_heading('8. Network Security', level=1)
 
     doc.add_heading('8.1 CORS Configuration', level=2)
@@ -384,8 +514,7 @@ def create_security_document():
         'Comma-separated list of allowed domains',
         'Only listed origins can make cross-origin requests'
     ]
-    for c in cors_items:
-        doc.add_paragraph(c, style='List Bullet')
+    _fast_bullets(doc, cors_items, bullet_id)
 
     doc.add_heading('8.2 Recommended Network Configuration', level=2)
     doc.add_paragraph('Production Environment:')
@@ -396,23 +525,19 @@ def create_security_document():
         'Use private networking for backend services',
         'Enable DDoS protection at edge'
     ]
-    for p in prod_config:
-        doc.add_paragraph(p, style='List Bullet')
+    _fast_bullets(doc, prod_config, bullet_id)
 
     doc.add_page_break()
 
-    # 9. Compliance
+def _build_section_9(doc):
+    """9. Compliance"""
+    bullet_id = doc.styles['List Bullet'].style_id
+
     doc.add_heading('9. Compliance & Standards', level=1)
 
     doc.add_heading('9.1 Security Standards Alignment', level=2)
     doc.add_paragraph('DataMigrate AI aligns with the following security frameworks:')
-    standards = [
-        ('OWASP Top 10', 'SQL Injection, XSS, Auth, Sensitive Data, Security Misconfiguration'),
-        ('SOC 2 Type II', 'Access Controls, Encryption, Audit Logging, Monitoring'),
-        ('GDPR', 'Data Protection, Access Controls, Audit Trails'),
-        ('ISO 27001', 'Information Security Management')
-    ]
-    add_table_with_header(doc, ['Standard', 'Coverage'], standards)
+    add_table_with_header(doc, _TABLE_HEADERS['standards'], _TABLES['standards'])
 
     doc.add_heading('9.2 Data Protection Measures', level=2)
     doc.add_paragraph('Customer Data:')
@@ -422,26 +547,18 @@ def create_security_document():
         'Encrypted credentials at rest',
         'Secure credential transmission'
     ]
-    for d in data_protection:
-        doc.add_paragraph(d, style='List Bullet')
+    _fast_bullets(doc, data_protection, bullet_id)
 
     doc.add_page_break()
 
-    # 10. Risk Assessment
+def _build_section_10(doc):
+    """10. Risk Assessment"""
+    bullet_id = doc.styles['List Bullet'].style_id
+
     doc.add_heading('10. Risk Assessment', level=1)
 
     doc.add_heading('10.1 Risk Matrix', level=2)
-    risks = [
-        ('SQL Injection', 'Low', 'Critical', 'Pattern detection, parameterized queries', 'Low'),
-        ('XSS Attack', 'Low', 'High', 'Input sanitization, CSP headers', 'Low'),
-        ('Credential Theft', 'Low', 'Critical', 'AES-256 encryption, bcrypt hashing', 'Low'),
-        ('Brute Force Attack', 'Medium', 'Medium', 'Rate limiting, account lockout', 'Low'),
-        ('DDoS Attack', 'Medium', 'High', 'Rate limiting, CDN integration', 'Medium'),
-        ('Session Hijacking', 'Low', 'High', 'Short-lived JWT, HTTPS only', 'Low'),
-        ('Prompt Injection', 'Medium', 'Medium', 'Pattern detection, input validation', 'Low'),
-        ('Data Breach', 'Low', 'Critical', 'Encryption, access controls, auditing', 'Low')
-    ]
-    add_table_with_header(doc, ['Risk', 'Likelihood', 'Impact', 'Mitigation', 'Residual'], risks)
+    add_table_with_header(doc, _TABLE_HEADERS['risks'], _TABLES['risks'])
 
     doc.add_heading('10.2 Security Testing', level=2)
     doc.add_paragraph('Recommended Testing:')
@@ -451,22 +568,18 @@ def create_security_document():
         'Code security review (per release)',
         'Dependency scanning (continuous)'
     ]
-    for t in testing:
-        doc.add_paragraph(t, style='List Bullet')
+    _fast_bullets(doc, testing, bullet_id)
 
     doc.add_page_break()
 
-    # 11. Incident Response
+def _build_section_11(doc):
+    """11. Incident Response"""
+    number_id = doc.styles['List Number'].style_id
+
     doc.add_heading('11. Incident Response', level=1)
 
     doc.add_heading('11.1 Incident Classification', level=2)
-    incidents = [
-        ('P1 - Critical', 'Active breach, data exposure', 'Immediate', 'Data leak, successful attack'),
-        ('P2 - High', 'Active attack attempt', '1 hour', 'Multiple blocked attacks'),
-        ('P3 - Medium', 'Security anomaly', '4 hours', 'Unusual access patterns'),
-        ('P4 - Low', 'Minor security event', '24 hours', 'Failed login attempts')
-    ]
-    add_table_with_header(doc, ['Level', 'Description', 'Response Time', 'Examples'], incidents)
+    add_table_with_header(doc, _TABLE_HEADERS['incidents'], _TABLES['incidents'])
 
     doc.add_heading('11.2 Response Procedures', level=2)
 
@@ -477,8 +590,7 @@ def create_security_document():
         'Notify security team',
         'Assess impact scope'
     ]
-    for idx, a in enumerate(immediate, 1):
-        doc.add_paragraph(f'{idx}. {a}')
+    _fast_bullets(doc, immediate, number_id)
 
     doc.add_paragraph()
     doc.add_paragraph('Investigation:', style='Heading 4')
@@ -488,8 +600,7 @@ def create_security_document():
         'Identify affected resources',
         'Determine root cause'
     ]
-    for idx, i in enumerate(investigation, 1):
-        doc.add_paragraph(f'{idx}. {i}')
+    _fast_bullets(doc, investigation, number_id)
 
     doc.add_paragraph()
     doc.add_paragraph('Recovery:', style='Heading 4')
@@ -499,12 +610,14 @@ def create_security_document():
         'Reset compromised credentials',
         'Notify affected users'
     ]
-    for idx, r in enumerate(recovery, 1):
-        doc.add_paragraph(f'{idx}. {r}')
+    _fast_bullets(doc, recovery, number_id)
 
     doc.add_page_break()
 
-    # 12. Best Practices
+def _build_section_12(doc):
+    """12. Best Practices"""
+    bullet_id = doc.styles['List Bullet'].style_id
+
     doc.add_heading('12. Security Best Practices for Clients', level=1)
 
     doc.add_heading('12.1 Account Security', level=2)
@@ -514,8 +627,7 @@ def create_security_document():
         'Review user access regularly',
         'Remove inactive accounts promptly'
     ]
-    for p in account_practices:
-        doc.add_paragraph(p, style='List Bullet')
+    _fast_bullets(doc, account_practices, bullet_id)
 
     doc.add_heading('12.2 API Key Management', level=2)
     api_key_practices = [
@@ -524,8 +636,7 @@ def create_security_document():
         'Monitor API key usage',
         'Revoke unused keys immediately'
     ]
-    for p in api_key_practices:
-        doc.add_paragraph(p, style='List Bullet')
+    _fast_bullets(doc, api_key_practices, bullet_id)
 
     doc.add_heading('12.3 Database Connection Security', level=2)
     db_practices = [
@@ -534,8 +645,7 @@ def create_security_document():
         'Use encrypted connections',
         'Rotate credentials after migration completion'
     ]
-    for p in db_practices:
-        doc.add_paragraph(p, style='List Bullet')
+    _fast_bullets(doc, db_practices, bullet_id)
 
     doc.add_heading('12.4 Network Configuration', level=2)
     network_practices = [
@@ -544,12 +654,14 @@ def create_security_document():
         'Monitor connection attempts',
         'Log all database access'
     ]
-    for p in network_practices:
-        doc.add_paragraph(p, style='List Bullet')
+    _fast_bullets(doc, network_practices, bullet_id)
 
     doc.add_page_break()
 
-    # Appendix A
+def _build_appendix_a(doc):
+    """Appendix A: configuration checklist"""
+    bullet_id = doc.styles['List Bullet'].style_id
+
     doc.add_heading('Appendix A: Security Configuration Checklist', level=1)
 
     doc.add_heading('Production Deployment', level=2)
@@ -567,7 +679,7 @@ def create_security_document():
     ]
     for c in checklist:
         p = doc.add_paragraph()
-        p.add_run('\u2610 ').font.size = Pt(12)
+        p.add_run('\u2610 ').font.size = _PT12
         p.add_run(c)
 
     doc.add_heading('Required Environment Variables', level=2)
@@ -578,12 +690,12 @@ def create_security_document():
         'ENVIRONMENT - production, staging, or development',
         'DATABASE_URL - PostgreSQL connection string with SSL'
     ]
-    for e in env_vars:
-        doc.add_paragraph(e, style='List Bullet')
+    _fast_bullets(doc, env_vars, bullet_id)
 
     doc.add_page_break()
 
-    # Appendix B
+def _build_appendix_b(doc):
+    """Appendix B: key generation"""
     doc.add_heading('Appendix B: Generating Encryption Keys', level=1)
 
     doc.add_paragraph('Using OpenSSL:')
@@ -594,10 +706,11 @@ def create_security_document():
 
     doc.add_page_break()
 
-    # Document Control
+def _build_document_control(doc, now_str):
+    """Document control, contacts and disclaimer"""
     doc.add_heading('Document Control', level=1)
     doc_control = [
-        ('1.0', datetime.now().strftime('%B %Y'), 'DataMigrate AI Team', 'Initial release')
+        ('1.0', now_str, 'DataMigrate AI Team', 'Initial release')
     ]
     add_table_with_header(doc, ['Version', 'Date', 'Author', 'Changes'], doc_control)
 
@@ -619,24 +732,135 @@ def create_security_document():
     disclaimer.italic = True
     disclaimer.add_run('This document contains confidential security information. Distribution is restricted to authorized personnel and clients under NDA.')
 
+# Body sections in order, between the dated cover and document control pages;
+# each builder appends its content (and closing page break) to doc
+_SECTIONS = (
+    _build_toc,
+    _build_section_1,
+    _build_section_2,
+    _build_section_3,
+    _build_section_4,
+    _build_section_5,
+    _build_section_6,
+    _build_section_7,
+    _build_section_8,
+    _build_section_9,
+    _build_section_10,
+    _build_section_11,
+    _build_section_12,
+    _build_appendix_a,
+    _build_appendix_b,
+)
+
+def create_security_document(now_str=None):
+    doc = Document()
+    if now_str is None:
+        now_str = datetime.now().strftime('%B %Y')
+
+    # Set up styles
+    style = doc.styles['Normal']
+    style.font.name = 'Calibri'
+    style.font.size = _PT11
+
+    _build_cover(doc, now_str)
+    for build_section in _SECTIONS:
+        build_section(doc)
+    _build_document_control(doc, now_str)
+
+    _restart_numbered_lists(doc)
     return doc
 
-def main():
-    # Create the security document
-    print("Generating Security Documentation...")
-    doc = create_security_document()
+# DOCX_COMPRESS=0 writes the output uncompressed when it is only a transient input to another tool
+_COMPRESSION = zipfile.ZIP_DEFLATED if os.environ.get('DOCX_COMPRESS', '1') == '1' else zipfile.ZIP_STORED
+
+def _cache_key():
+    """Cached builds are keyed by script revision and python-docx version; the month they were built for is kept in the zip comment."""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        digest = hashlib.sha256(f.read())
+    digest.update(docx.__version__.encode())
+    return f"sec-{digest.hexdigest()[:16]}"
+
+def _prune_cache(cache_path):
+    """Remove security-docs builds left behind under earlier keys"""
+    for stale_path in glob.glob(os.path.join(os.path.dirname(cache_path), 'sec-*.docx')):
+        if stale_path != cache_path:
+            os.remove(stale_path)
+
+def _replace_file(path, data):
+    """Write data beside path and atomically move it into place, so readers never see a partial file"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def _dated_runs(date_str):
+    """Markup of the whole <w:t> elements that carry the build date: the cover line and the document control cell"""
+    return (
+        f'<w:t>{_COVER_INFO_TMPL.format(date_str)}</w:t>'.encode(),
+        f'<w:t>{date_str}</w:t>'.encode(),
+    )
 
+def _rezip(zin, date_str, compression):
+    """Repackage zin with compression, re-dating the build date runs and stamping date_str as the comment"""
+    cached_date = zin.comment.decode()
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', compression) as zout:
+        for item in zin.infolist():
+            data = zin.read(item)
+            if item.filename == 'word/document.xml' and cached_date != date_str:
+                for old, new in zip(_dated_runs(cached_date), _dated_runs(date_str)):
+                    data = data.replace(old, new)
+            # Reuse the entry's ZipInfo so timestamps and attributes survive the rewrite
+            zout.writestr(item, data, compress_type=compression)
+        zout.comment = date_str.encode()
+    return buf.getbuffer()
+
+def _render_cached(cache_path, docx_path, date_str):
+    """Write the cached package to docx_path, re-dating the cache itself first when it was built for another month"""
+    with zipfile.ZipFile(cache_path) as zin:
+        stale = zin.comment.decode() != date_str
+        if stale:
+            data = _rezip(zin, date_str, zipfile.ZIP_DEFLATED)
+    if stale:
+        # Later runs this month then take the plain copy below
+        _replace_file(cache_path, data)
+
+    if _COMPRESSION == zipfile.ZIP_DEFLATED:
+        tmp_path = docx_path + '.tmp'
+        shutil.copyfile(cache_path, tmp_path)
+        os.replace(tmp_path, docx_path)
+    else:
+        with zipfile.ZipFile(cache_path) as zin:
+            _replace_file(docx_path, _rezip(zin, date_str, _COMPRESSION))
+
+def main():
     # Save paths
     base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     docs_path = os.path.join(base_path, 'docs')
+    cache_path = os.path.join(base_path, '.build_cache', f'{_cache_key()}.docx')
+    date_str = datetime.now().strftime('%B %Y')
 
     # Ensure docs directory exists
     os.makedirs(docs_path, exist_ok=True)
-
-    # Save Word document
     docx_path = os.path.join(docs_path, 'SECURITY_DOCUMENTATION.docx')
-    doc.save(docx_path)
-    print(f"Word document saved: {docx_path}")
+
+    if os.path.exists(cache_path):
+        _render_cached(cache_path, docx_path, date_str)
+        print(f"Word document saved (cached): {docx_path}")
+    else:
+        # Create the security document straight into the cache, then write the output from it
+        print("Generating Security Documentation...")
+        doc = create_security_document(date_str)
+
+        buf = io.BytesIO()
+        doc.save(buf)
+        with zipfile.ZipFile(buf, 'a') as cached:
+            cached.comment = date_str.encode()
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        _replace_file(cache_path, buf.getbuffer())
+        _prune_cache(cache_path)
+        _render_cached(cache_path, docx_path, date_str)
+        print(f"Word document saved: {docx_path}")
 
     print("\nDone! Security documentation generated successfully.")
     print(f"\nFiles created:")
@@ -1,57 +1,84 @@
 """
 Generate Security Metrics Report as Word and PDF documents
 """
+import atexit
 import os
+import socket
+import sys
+import time
 from docx import Document
-from docx.shared import Inches, Pt, RGBColor
+from docx.shared import Emu, Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml.ns import nsdecls
+from docx.oxml import parse_xml
 import subprocess
-
-def set_cell_shading(cell, color):
-    """Set cell background color"""
-    shading_elm = OxmlElement('w:shd')
-    shading_elm.set(qn('w:fill'), color)
-    cell._tc.get_or_add_tcPr().append(shading_elm)
-
-def create_security_metrics_doc():
-    doc = Document()
-
-    # Title
-    title = doc.add_heading('DataMigrate AI', 0)
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-    subtitle = doc.add_paragraph('Security Metrics & Assessment Report')
-    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    subtitle.runs[0].font.size = Pt(18)
-    subtitle.runs[0].font.color.rgb = RGBColor(0, 102, 204)
-
-    # Executive Summary
-    doc.add_heading('Executive Summary', level=1)
-    doc.add_paragraph(
-        'DataMigrate AI has implemented a comprehensive, multi-layered security architecture '
-        'that provides enterprise-grade protection for database migration operations. This report '
-        'presents quantitative metrics and visual representations of our security posture.'
+from copy import deepcopy
+from xml.sax.saxutils import escape
+
+# Default template parsed once at import; each build works on a deep copy of it
+_TEMPLATE_DOC = Document()
+
+# Subtitle font, header text color (hex RGB) shared across the report
+_BLUE = RGBColor(0x00, 0x66, 0xCC)
+_PT18 = Pt(18)
+_WHITE = 'FFFFFF'
+
+# Gaps above summary lines and the footer, in place of empty spacer paragraphs
+_SUMMARY_SPACE = Pt(12)
+_FOOTER_SPACE = Pt(24)
+
+# Table markup: bold header cells on a colored fill, plain data cells
+_TBL_TMPL = (
+    f'<w:tbl {nsdecls("w")}><w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:type="auto" w:w="0"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+    '</w:tblPr><w:tblGrid>{grid}</w:tblGrid>{rows}</w:tbl>'
+)
+_GRID_COL_TMPL = '<w:gridCol w:w="{}"/>'
+_ROW_TMPL = '<w:tr>{cells}</w:tr>'
+# Cells are split around their text: the opening fragment is resolved once per table
+_HEADER_CELL_OPEN_TMPL = (
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/><w:shd w:fill="{fill}"/></w:tcPr>'
+    '<w:p><w:r><w:rPr><w:b/>{color}</w:rPr><w:t>'
+)
+_COLOR_TMPL = '<w:color w:val="{}"/>'
+_CELL_OPEN_TMPL = '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr><w:p><w:r><w:t>'
+_CELL_CLOSE = '</w:t></w:r></w:p></w:tc>'
+
+# Text width of the default template (Letter, 1.25" side margins), split evenly across table columns
+_BLOCK_WIDTH = Inches(6)
+
+def render_table(headers, rows, header_color, header_font_color=_WHITE):
+    """Render a table with a colored header to <w:tbl> markup"""
+    width = Emu(_BLOCK_WIDTH // len(headers)).twips
+    color = _COLOR_TMPL.format(header_font_color) if header_font_color else ''
+    header_open = _HEADER_CELL_OPEN_TMPL.format(width=width, fill=header_color, color=color)
+    cell_open = _CELL_OPEN_TMPL.format(width=width)
+    header_row = _ROW_TMPL.format(cells=''.join(
+        header_open + escape(header) + _CELL_CLOSE for header in headers
+    ))
+    data_rows = ''.join(
+        _ROW_TMPL.format(cells=''.join(
+            cell_open + escape(value) + _CELL_CLOSE for value in row_data
+        ))
+        for row_data in rows
+    )
+    return _TBL_TMPL.format(
+        grid=_GRID_COL_TMPL.format(width) * len(headers),
+        rows=header_row + data_rows,
     )
 
-    # Overall Score Box
-    doc.add_heading('Overall Security Rating: 94/100 (A+)', level=2)
-
-    # Score breakdown table
-    score_table = doc.add_table(rows=8, cols=3)
-    score_table.style = 'Table Grid'
-
-    headers = ['Security Domain', 'Score', 'Status']
-    for i, header in enumerate(headers):
-        cell = score_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].bold = True
-        set_cell_shading(cell, '0066CC')
-        cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    scores = [
+# Report payload shared by the Word and PDF renderers
+_SUMMARY = (
+    'DataMigrate AI has implemented a comprehensive, multi-layered security architecture '
+    'that provides enterprise-grade protection for database migration operations. This report '
+    'presents quantitative metrics and visual representations of our security posture.'
+)
+_CONCLUSION_INTRO = 'DataMigrate AI provides enterprise-grade security that exceeds industry standards:'
+_FOOTER = 'Report Generated: December 2024 | Version: 1.0 | Classification: Public'
+
+_TABLES = {
+    'scores': (
         ('Authentication & Access Control', '95%', 'Excellent'),
         ('Data Encryption', '98%', 'Excellent'),
         ('Input Validation', '92%', 'Excellent'),
@@ -59,30 +86,8 @@ def create_security_metrics_doc():
         ('Monitoring & Logging', '96%', 'Excellent'),
         ('API Security', '93%', 'Excellent'),
         ('AI/ML Security', '91%', 'Very Good'),
-    ]
-
-    for i, (domain, score, status) in enumerate(scores, 1):
-        score_table.rows[i].cells[0].text = domain
-        score_table.rows[i].cells[1].text = score
-        score_table.rows[i].cells[2].text = status
-
-    doc.add_paragraph()
-
-    # OWASP Top 10 Coverage
-    doc.add_heading('OWASP Top 10 Protection Coverage', level=1)
-
-    owasp_table = doc.add_table(rows=11, cols=4)
-    owasp_table.style = 'Table Grid'
-
-    owasp_headers = ['OWASP Category', 'Status', 'Controls', 'Coverage']
-    for i, header in enumerate(owasp_headers):
-        cell = owasp_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].bold = True
-        set_cell_shading(cell, '28A745')
-        cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    owasp_data = [
+    ),
+    'owasp': (
         ('A01 - Broken Access Control', '✓ Protected', 'RBAC, JWT, Sessions', '100%'),
         ('A02 - Cryptographic Failures', '✓ Protected', 'AES-256-GCM, TLS 1.3', '100%'),
         ('A03 - Injection', '✓ Protected', 'Parameterized Queries', '100%'),
@@ -93,58 +98,15 @@ def create_security_metrics_doc():
         ('A08 - Data Integrity', '✓ Protected', 'Input Validation', '92%'),
         ('A09 - Logging Failures', '✓ Protected', 'Comprehensive Logging', '98%'),
         ('A10 - SSRF', '✓ Protected', 'IP Validation', '100%'),
-    ]
-
-    for i, (category, status, controls, coverage) in enumerate(owasp_data, 1):
-        owasp_table.rows[i].cells[0].text = category
-        owasp_table.rows[i].cells[1].text = status
-        owasp_table.rows[i].cells[2].text = controls
-        owasp_table.rows[i].cells[3].text = coverage
-
-    doc.add_paragraph()
-    doc.add_paragraph('Average OWASP Coverage: 96.8%').runs[0].bold = True
-
-    # Encryption Standards
-    doc.add_heading('Encryption Standards', level=1)
-
-    crypto_table = doc.add_table(rows=6, cols=4)
-    crypto_table.style = 'Table Grid'
-
-    crypto_headers = ['Component', 'Algorithm', 'Key Size', 'Standard']
-    for i, header in enumerate(crypto_headers):
-        cell = crypto_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].bold = True
-        set_cell_shading(cell, '6C757D')
-        cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    crypto_data = [
+    ),
+    'crypto': (
         ('Password Hashing', 'bcrypt', 'Cost 10', 'NIST SP 800-132'),
         ('Token Signing', 'HMAC-SHA256', '256-bit', 'RFC 7519'),
         ('Data Encryption', 'AES-256-GCM', '256-bit', 'NIST SP 800-38D'),
         ('Transport', 'TLS 1.3', '256-bit', 'RFC 8446'),
         ('API Keys', 'SHA-256', '256-bit', 'FIPS 180-4'),
-    ]
-
-    for i, row_data in enumerate(crypto_data, 1):
-        for j, value in enumerate(row_data):
-            crypto_table.rows[i].cells[j].text = value
-
-    # Attack Prevention Statistics
-    doc.add_heading('Attack Prevention Statistics', level=1)
-
-    attack_table = doc.add_table(rows=8, cols=3)
-    attack_table.style = 'Table Grid'
-
-    attack_headers = ['Attack Type', 'Detection Rate', 'Response Time']
-    for i, header in enumerate(attack_headers):
-        cell = attack_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].bold = True
-        set_cell_shading(cell, 'DC3545')
-        cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    attack_data = [
+    ),
+    'attack': (
         ('SQL Injection', '99.7%', '< 1ms'),
         ('Cross-Site Scripting (XSS)', '99.2%', '< 1ms'),
         ('Command Injection', '99.8%', '< 1ms'),
@@ -152,41 +114,8 @@ def create_security_metrics_doc():
         ('Prompt Injection', '97.5%', '< 2ms'),
         ('SSRF Attacks', '99.9%', '< 1ms'),
         ('Credential Stuffing', '98.0%', '< 1ms'),
-    ]
-
-    for i, row_data in enumerate(attack_data, 1):
-        for j, value in enumerate(row_data):
-            attack_table.rows[i].cells[j].text = value
-
-    doc.add_paragraph()
-    doc.add_paragraph('Average Detection Rate: 99.1%').runs[0].bold = True
-
-    # Account Lockout Protection
-    doc.add_heading('Account Lockout Protection System', level=1)
-
-    lockout_para = doc.add_paragraph()
-    lockout_para.add_run('Key Features:\n').bold = True
-    lockout_para.add_run('• Failed Attempts Before Lockout: 5 attempts\n')
-    lockout_para.add_run('• Initial Lockout Duration: 15 minutes\n')
-    lockout_para.add_run('• Progressive Lockout Multiplier: 2x per lock\n')
-    lockout_para.add_run('• Maximum Lockout Duration: 24 hours\n')
-    lockout_para.add_run('• IP-Based Blocking Threshold: 20 attempts\n')
-
-    # Security Headers
-    doc.add_heading('Security Headers (Grade: A+)', level=1)
-
-    headers_table = doc.add_table(rows=9, cols=3)
-    headers_table.style = 'Table Grid'
-
-    headers_headers = ['Header', 'Value', 'Protection']
-    for i, header in enumerate(headers_headers):
-        cell = headers_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].bold = True
-        set_cell_shading(cell, '17A2B8')
-        cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    headers_data = [
+    ),
+    'headers': (
         ('Content-Security-Policy', 'Configured', 'Prevents XSS'),
         ('X-Frame-Options', 'DENY', 'Prevents Clickjacking'),
         ('X-Content-Type-Options', 'nosniff', 'Prevents MIME Sniffing'),
@@ -195,73 +124,295 @@ def create_security_metrics_doc():
         ('Referrer-Policy', 'strict-origin-when-cross-origin', 'Controls Referrer'),
         ('Permissions-Policy', 'Configured', 'Limits Browser APIs'),
         ('Cache-Control', 'no-store', 'Prevents Caching'),
-    ]
-
-    for i, row_data in enumerate(headers_data, 1):
-        for j, value in enumerate(row_data):
-            headers_table.rows[i].cells[j].text = value
-
-    # Compliance Readiness
-    doc.add_heading('Compliance Framework Alignment', level=1)
-
-    compliance_table = doc.add_table(rows=7, cols=3)
-    compliance_table.style = 'Table Grid'
-
-    compliance_headers = ['Framework', 'Coverage', 'Status']
-    for i, header in enumerate(compliance_headers):
-        cell = compliance_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].bold = True
-        set_cell_shading(cell, 'FFC107')
-
-    compliance_data = [
+    ),
+    'compliance': (
         ('GDPR', '85%', 'Ready'),
         ('SOC 2 Type II', '92%', 'Ready'),
         ('ISO 27001', '88%', 'Ready'),
         ('HIPAA', '90%', 'Ready'),
         ('PCI-DSS', '80%', 'In Progress'),
         ('NIST CSF', '93%', 'Ready'),
-    ]
+    ),
+}
+
+_TABLE_HEADERS = {
+    'scores': ('Security Domain', 'Score', 'Status'),
+    'owasp': ('OWASP Category', 'Status', 'Controls', 'Coverage'),
+    'crypto': ('Component', 'Algorithm', 'Key Size', 'Standard'),
+    'attack': ('Attack Type', 'Detection Rate', 'Response Time'),
+    'headers': ('Header', 'Value', 'Protection'),
+    'compliance': ('Framework', 'Coverage', 'Status'),
+}
+
+# Header fill and text color per table; None keeps the default (black) text
+_TABLE_COLORS = {
+    'scores': ('0066CC', _WHITE),
+    'owasp': ('28A745', _WHITE),
+    'crypto': ('6C757D', _WHITE),
+    'attack': ('DC3545', _WHITE),
+    'headers': ('17A2B8', _WHITE),
+    'compliance': ('FFC107', None),
+}
+
+_BULLETS = {
+    'lockout': (
+        '• Failed Attempts Before Lockout: 5 attempts',
+        '• Initial Lockout Duration: 15 minutes',
+        '• Progressive Lockout Multiplier: 2x per lock',
+        '• Maximum Lockout Duration: 24 hours',
+        '• IP-Based Blocking Threshold: 20 attempts',
+    ),
+    'pentest': (
+        '• Critical Vulnerabilities Found: 0',
+        '• High Vulnerabilities Found: 0',
+        '• Medium Vulnerabilities Found: 2 (Mitigated)',
+        '• Low Vulnerabilities Found: 5 (Accepted Risk)',
+    ),
+    'conclusion': (
+        '• 94/100 Overall Security Score',
+        '• 99.1% Average Threat Detection Rate',
+        '• 100% Encryption Coverage for sensitive data',
+        '• A+ Security Headers Rating',
+        '• 88% Compliance Framework Alignment',
+        '• Zero Critical or High Vulnerabilities',
+    ),
+}
+
+def _add_table(doc, key):
+    """Render a report table by key and insert it ahead of the section properties"""
+    header_color, header_font_color = _TABLE_COLORS[key]
+    markup = render_table(_TABLE_HEADERS[key], _TABLES[key], header_color, header_font_color)
+    doc.element.body._insert_tbl(parse_xml(markup))
+
+def add_summary_line(doc, text):
+    """Add a bold summary line set off from the table above it"""
+    para = doc.add_paragraph()
+    para.add_run(text).bold = True
+    para.paragraph_format.space_before = _SUMMARY_SPACE
+
+def _bullet_text(key):
+    """Bullet lines as one run of text, one line per bullet"""
+    return '\n'.join(_BULLETS[key]) + '\n'
+
+def create_security_metrics_doc():
+    doc = deepcopy(_TEMPLATE_DOC)
+
+    # Title
+    title = doc.add_heading('DataMigrate AI', 0)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    subtitle = doc.add_paragraph('Security Metrics & Assessment Report')
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    subtitle_font = subtitle.runs[0].font
+    subtitle_font.size = _PT18
+    subtitle_font.color.rgb = _BLUE
+
+    # Executive Summary
+    doc.add_heading('Executive Summary', level=1)
+    doc.add_paragraph(_SUMMARY)
+
+    # Overall Score Box
+    doc.add_heading('Overall Security Rating: 94/100 (A+)', level=2)
+
+    # Score breakdown table
+    _add_table(doc, 'scores')
+
+    # OWASP Top 10 Coverage
+    doc.add_heading('OWASP Top 10 Protection Coverage', level=1)
+    _add_table(doc, 'owasp')
+
+    add_summary_line(doc, 'Average OWASP Coverage: 96.8%')
+
+    # Encryption Standards
+    doc.add_heading('Encryption Standards', level=1)
+    _add_table(doc, 'crypto')
+
+    # Attack Prevention Statistics
+    doc.add_heading('Attack Prevention Statistics', level=1)
+    _add_table(doc, 'attack')
+
+    add_summary_line(doc, 'Average Detection Rate: 99.1%')
+
+    # Account Lockout Protection
+    doc.add_heading('Account Lockout Protection System', level=1)
+
+    lockout_para = doc.add_paragraph()
+    lockout_para.add_run('Key Features:\n').bold = True
+    lockout_para.add_run(_bullet_text('lockout'))
 
-    for i, row_data in enumerate(compliance_data, 1):
-        for j, value in enumerate(row_data):
-            compliance_table.rows[i].cells[j].text = value
+    # Security Headers
+    doc.add_heading('Security Headers (Grade: A+)', level=1)
+    _add_table(doc, 'headers')
+
+    # Compliance Readiness
+    doc.add_heading('Compliance Framework Alignment', level=1)
+    _add_table(doc, 'compliance')
 
-    doc.add_paragraph()
-    doc.add_paragraph('Average Compliance Readiness: 88%').runs[0].bold = True
+    add_summary_line(doc, 'Average Compliance Readiness: 88%')
 
     # Penetration Testing Summary
     doc.add_heading('Penetration Testing Results', level=1)
 
     pentest_para = doc.add_paragraph()
     pentest_para.add_run('Test Results Summary:\n').bold = True
-    pentest_para.add_run('• Critical Vulnerabilities Found: 0\n')
-    pentest_para.add_run('• High Vulnerabilities Found: 0\n')
-    pentest_para.add_run('• Medium Vulnerabilities Found: 2 (Mitigated)\n')
-    pentest_para.add_run('• Low Vulnerabilities Found: 5 (Accepted Risk)\n\n')
+    pentest_para.add_run(_bullet_text('pentest') + '\n')
     pentest_para.add_run('Overall Status: SECURE').bold = True
 
     # Conclusion
     doc.add_heading('Conclusion', level=1)
-    doc.add_paragraph(
-        'DataMigrate AI provides enterprise-grade security that exceeds industry standards:'
-    )
+    doc.add_paragraph(_CONCLUSION_INTRO)
 
     conclusion_para = doc.add_paragraph()
-    conclusion_para.add_run('• 94/100 Overall Security Score\n')
-    conclusion_para.add_run('• 99.1% Average Threat Detection Rate\n')
-    conclusion_para.add_run('• 100% Encryption Coverage for sensitive data\n')
-    conclusion_para.add_run('• A+ Security Headers Rating\n')
-    conclusion_para.add_run('• 88% Compliance Framework Alignment\n')
-    conclusion_para.add_run('• Zero Critical or High Vulnerabilities\n')
+    conclusion_para.add_run(_bullet_text('conclusion'))
 
     # Footer
-    doc.add_paragraph()
-    footer = doc.add_paragraph('Report Generated: December 2024 | Version: 1.0 | Classification: Public')
+    footer = doc.add_paragraph(_FOOTER)
     footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    footer.paragraph_format.space_before = _FOOTER_SPACE
 
     return doc
 
+# TrueType fonts for the PDF tables; the built-in Helvetica has no glyph for '✓'
+_PDF_FONT = ('DejaVuSans', 'DejaVuSans.ttf')
+_PDF_BOLD_FONT = ('DejaVuSans-Bold', 'DejaVuSans-Bold.ttf')
+
+def _pdf_table_fonts():
+    """Register DejaVu Sans for table text; None when it is not on ReportLab's font path"""
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFError, TTFont
+    try:
+        for name, filename in (_PDF_FONT, _PDF_BOLD_FONT):
+            if name not in pdfmetrics.getRegisteredFontNames():
+                pdfmetrics.registerFont(TTFont(name, filename))
+    except TTFError:
+        return None
+    return _PDF_FONT[0], _PDF_BOLD_FONT[0]
+
+def create_security_metrics_pdf(pdf_path):
+    """Render the report straight to PDF with ReportLab, skipping the docx round trip"""
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+    styles = getSampleStyleSheet()
+    subtitle_style = ParagraphStyle(
+        'Subtitle', parent=styles['Normal'], alignment=TA_CENTER,
+        fontSize=18, leading=22, textColor=colors.HexColor('#0066CC')
+    )
+    footer_style = ParagraphStyle('Footer', parent=styles['Normal'], alignment=TA_CENTER)
+    body = styles['BodyText']
+    doc = SimpleDocTemplate(pdf_path)
+
+    # Without a font carrying '✓', drop the mark rather than print empty boxes
+    fonts = _pdf_table_fonts()
+    cell_font, header_font = fonts or ('Helvetica', 'Helvetica-Bold')
+
+    def cell_text(value):
+        return value if fonts else value.replace('✓ ', '')
+
+    def heading(text, level=1):
+        return Paragraph(escape(text), styles[f'Heading{level}'])
+
+    def bold(text):
+        return Paragraph(f'<b>{escape(text)}</b>', body)
+
+    def bullets(key, title=None):
+        lines = [escape(line) for line in _BULLETS[key]]
+        if title:
+            lines.insert(0, f'<b>{escape(title)}</b>')
+        return Paragraph('<br/>'.join(lines), body)
+
+    def table(key):
+        header_color, header_font_color = _TABLE_COLORS[key]
+        header_text = colors.HexColor(f'#{header_font_color}') if header_font_color else colors.black
+        # Cells are Paragraphs so long entries wrap inside their column, as they do in the docx
+        cell_style = ParagraphStyle('Cell', parent=body, fontName=cell_font, fontSize=9, leading=11)
+        header_style = ParagraphStyle('CellHeader', parent=cell_style, fontName=header_font, textColor=header_text)
+        headers = [Paragraph(escape(value), header_style) for value in _TABLE_HEADERS[key]]
+        rows = [[Paragraph(escape(cell_text(value)), cell_style) for value in row] for row in _TABLES[key]]
+        # Equal columns across the frame, as _BLOCK_WIDTH is split for the docx tables
+        col_width = doc.width / len(headers)
+        tbl = Table([headers, *rows], colWidths=[col_width] * len(headers), repeatRows=1)
+        tbl.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(f'#{header_color}')),
+        ]))
+        return tbl
+
+    spacer = Spacer(1, 12)
+    story = [
+        Paragraph('DataMigrate AI', styles['Title']),
+        Paragraph(escape('Security Metrics & Assessment Report'), subtitle_style),
+        heading('Executive Summary'),
+        Paragraph(escape(_SUMMARY), body),
+        heading('Overall Security Rating: 94/100 (A+)', level=2),
+        table('scores'),
+        heading('OWASP Top 10 Protection Coverage'),
+        table('owasp'),
+        spacer,
+        bold('Average OWASP Coverage: 96.8%'),
+        heading('Encryption Standards'),
+        table('crypto'),
+        heading('Attack Prevention Statistics'),
+        table('attack'),
+        spacer,
+        bold('Average Detection Rate: 99.1%'),
+        heading('Account Lockout Protection System'),
+        bullets('lockout', title='Key Features:'),
+        heading('Security Headers (Grade: A+)'),
+        table('headers'),
+        heading('Compliance Framework Alignment'),
+        table('compliance'),
+        spacer,
+        bold('Average Compliance Readiness: 88%'),
+        heading('Penetration Testing Results'),
+        bullets('pentest', title='Test Results Summary:'),
+        spacer,
+        bold('Overall Status: SECURE'),
+        heading('Conclusion'),
+        Paragraph(escape(_CONCLUSION_INTRO), body),
+        bullets('conclusion'),
+        spacer,
+        Paragraph(escape(_FOOTER), footer_style),
+    ]
+    doc.build(story)
+
+# unoserver's default endpoint; it keeps one headless soffice warm behind it
+_UNOSERVER_HOST = '127.0.0.1'
+_UNOSERVER_PORT = 2003
+
+def _unoserver_listening():
+    """Check whether a unoserver instance is accepting connections"""
+    try:
+        with socket.create_connection((_UNOSERVER_HOST, _UNOSERVER_PORT), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+def _ensure_unoserver():
+    """Start unoserver unless one is already running; a server we start is stopped at exit"""
+    if _unoserver_listening():
+        return
+    server = subprocess.Popen(
+        ['unoserver', '--interface', _UNOSERVER_HOST, '--port', str(_UNOSERVER_PORT)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    atexit.register(server.terminate)
+    deadline = time.monotonic() + 30
+    while not _unoserver_listening():
+        if server.poll() is not None or time.monotonic() > deadline:
+            raise RuntimeError('unoserver did not come up')
+        time.sleep(0.2)
+
+def convert_with_server(docx_path, pdf_path):
+    """Convert through a persistent unoserver instead of cold-starting soffice"""
+    from unoserver.client import UnoClient
+    _ensure_unoserver()
+    UnoClient(server=_UNOSERVER_HOST, port=str(_UNOSERVER_PORT)).convert(
+        inpath=docx_path, outpath=pdf_path
+    )
+
 def main():
     # Create docs directory if not exists
     docs_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'docs')
@@ -276,7 +427,29 @@ def main():
     # Try to convert to PDF using different methods
     pdf_path = os.path.join(docs_dir, 'SECURITY_METRICS_REPORT.pdf')
 
-    # Method 1: Try docx2pdf
+    # Method 1: --server asks for the Word layout through a long-lived unoserver,
+    # so it is tried before the direct ReportLab rendering
+    if '--server' in sys.argv[1:]:
+        try:
+            convert_with_server(docx_path, pdf_path)
+            print(f"Generated: {pdf_path}")
+            return
+        except ImportError:
+            print("unoserver not available, trying alternative methods...")
+        except Exception as e:
+            print(f"unoserver conversion failed: {e}")
+
+    # Method 2: Render the PDF directly from the report data
+    try:
+        create_security_metrics_pdf(pdf_path)
+        print(f"Generated: {pdf_path}")
+        return
+    except ImportError:
+        print("reportlab not available, trying alternative methods...")
+    except Exception as e:
+        print(f"reportlab failed: {e}")
+
+    # Method 3: Try docx2pdf
     try:
         from docx2pdf import convert
         convert(docx_path, pdf_path)
@@ -287,7 +460,7 @@ def main():
     except Exception as e:
         print(f"docx2pdf failed: {e}")
 
-    # Method 2: Try LibreOffice
+    # Method 4: Try LibreOffice
     try:
         subprocess.run([
             'soffice', '--headless', '--convert-to', 'pdf',
@@ -298,7 +471,7 @@ def main():
     except (subprocess.CalledProcessError, FileNotFoundError):
         print("LibreOffice not available")
 
-    print("PDF generation requires docx2pdf or LibreOffice. Word document created successfully.")
+    print("PDF generation requires reportlab, docx2pdf or LibreOffice. Word document created successfully.")
 
 if __name__ == '__main__':
     main()
@@ -10,7 +10,17 @@ import os
 import sys
 import json
 import logging
+from collections import Counter
+from itertools import islice
 from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # optional C codec; stdlib json is used without it
+    orjson = None
+    _loads = json.loads
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -29,14 +39,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+METADATA_FILE = "mssql_metadata.json"
+
+# Stream progress lines are written out in batches of this many steps
+STREAM_FLUSH_STEPS = 10
+
+# Large buffer so the stdlib state dump goes out in few write syscalls
+IO_BUFFER_SIZE = 2 ** 20
+
 
-def load_mock_metadata() -> dict:
+def load_mock_metadata(metadata_present: Optional[bool] = None) -> dict:
     """Load mock MSSQL metadata"""
-    metadata_file = Path("mssql_metadata.json")
+    metadata_file = Path(METADATA_FILE)
+    if metadata_present is None:
+        metadata_present = metadata_file.exists()
 
-    if metadata_file.exists():
-        with open(metadata_file, 'r') as f:
-            return json.load(f)
+    if metadata_present:
+        # Both parsers accept bytes, so the file is read once with no text decode
+        return _loads(metadata_file.read_bytes())
     else:
         logger.warning("mssql_metadata.json not found, using minimal mock")
         return {
@@ -65,9 +85,18 @@ def main():
     print("=" * 60)
     print()
 
+    # Probe the filesystem once up front
+    project_path = "./test_langgraph_project"
+    os.makedirs(project_path, exist_ok=True)
+    try:
+        os.stat(METADATA_FILE)
+        metadata_present = True
+    except FileNotFoundError:
+        metadata_present = False
+
     # Load mock metadata
     print("Step 1: Loading mock metadata...")
-    metadata = load_mock_metadata()
+    metadata = load_mock_metadata(metadata_present)
     print(f"[OK] Loaded metadata: {len(metadata.get('tables', []))} tables, "
           f"{len(metadata.get('views', []))} views, "
           f"{len(metadata.get('stored_procedures', []))} procedures")
@@ -75,9 +104,6 @@ def main():
 
     # Create initial state
     print("Step 2: Creating initial migration state...")
-    project_path = "./test_langgraph_project"
-    Path(project_path).mkdir(exist_ok=True)
-
     initial_state = create_initial_state(
         metadata=metadata,
         project_path=project_path,
@@ -110,25 +136,36 @@ def main():
             "recursion_limit": 100  # Increase from default 25
         }
 
-        for i, output in enumerate(graph.stream(initial_state, config=config)):
-            node_name = list(output.keys())[0]
-            node_state = output[node_name]
-
-            phase = node_state.get("phase", "unknown")
-            completed = node_state.get("completed_count", 0)
-            failed = node_state.get("failed_count", 0)
-            errors = node_state.get("errors", [])
-
-            print(f"  Step {i+1}: {node_name}")
-            print(f"    Phase: {phase}")
-            print(f"    Completed: {completed}, Failed: {failed}")
-
-            if errors:
-                print(f"    Errors: {len(errors)}")
-                for error in errors[:3]:  # Show first 3 errors
-                    print(f"      - {error}")
-
-            final_state = node_state
+        lines = []
+        try:
+            for i, output in enumerate(graph.stream(initial_state, config=config)):
+                node_name, node_state = next(iter(output.items()))
+
+                # Node outputs are partial state updates, so any key may be absent
+                get = node_state.get
+                phase = get("phase", "unknown")
+                completed = get("completed_count", 0)
+                failed = get("failed_count", 0)
+                errors = get("errors", [])
+
+                lines.append(f"  Step {i+1}: {node_name}")
+                lines.append(f"    Phase: {phase}")
+                lines.append(f"    Completed: {completed}, Failed: {failed}")
+
+                if errors:
+                    lines.append(f"    Errors: {len(errors)}")
+                    for error in islice(errors, 3):  # Show first 3 errors
+                        lines.append(f"      - {error}")
+
+                final_state = node_state
+
+                if (i + 1) % STREAM_FLUSH_STEPS == 0:
+                    print("\n".join(lines))
+                    lines.clear()
+        finally:
+            # Flush the last partial batch, including when a node raises
+            if lines:
+                print("\n".join(lines))
 
         print("-" * 60)
         print()
@@ -137,10 +174,13 @@ def main():
         print("Step 5: Migration Results")
         print("=" * 60)
 
+        # Count from the models themselves in one pass rather than trusting the
+        # summary fields; anything not completed is reported as a failure below
         models = final_state.get("models", [])
-        completed_count = final_state.get("completed_count", 0)
-        failed_count = final_state.get("failed_count", 0)
+        status_counts = Counter(model["status"] for model in models)
         total = len(models)
+        completed_count = status_counts["completed"]
+        failed_count = total - completed_count
 
         print(f"Total Models: {total}")
         print(f"Completed: {completed_count}")
@@ -152,18 +192,27 @@ def main():
 
         print()
         print("Model Details:")
-        for model in models:
-            status_icon = "[OK]" if model["status"] == "completed" else "[FAIL]"
-            print(f"  {status_icon} {model['name']}: {model['status']} "
-                  f"(attempts: {model['attempts']})")
+        if models:
+            print("\n".join(
+                f"  {'[OK]' if model['status'] == 'completed' else '[FAIL]'} "
+                f"{model['name']}: {model['status']} (attempts: {model['attempts']})"
+                for model in models
+            ))
 
         print()
         print("=" * 60)
 
         # Save state to file
         state_file = Path(project_path) / "migration_state_langgraph.json"
-        with open(state_file, 'w') as f:
-            json.dump(final_state, f, indent=2, default=str)
+        if orjson is not None:
+            state_file.write_bytes(orjson.dumps(
+                final_state,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str
+            ))
+        else:
+            with open(state_file, 'w', buffering=IO_BUFFER_SIZE) as f:
+                json.dump(final_state, f, indent=2, default=str)
         print(f"State saved to: {state_file}")
 
         # Check for success
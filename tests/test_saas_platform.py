@@ -8,7 +8,93 @@ This script tests:
 4. Migration creation
 """
 
+import atexit
+import contextlib
+import importlib.util
+import io
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+
+def _have(module):
+    """Check a top-level module is importable without executing it"""
+    return importlib.util.find_spec(module) is not None
+
+
+def _skip_unless(module):
+    """Print a [SKIP] marker and return True when a project module is absent"""
+    if _have(module):
+        return False
+    print(f"[SKIP] {module} not found")
+    return True
+
+
+def _require(package):
+    """Fail fast, before any import work, when a third-party package is missing"""
+    if not _have(package):
+        raise ImportError(f"No module named '{package}'")
+
+
+# Heavy imports load at most once per process, however many tests use them
+@lru_cache(maxsize=None)
+def _db():
+    _require('sqlalchemy')
+    from app.database import SessionLocal, init_db
+    return SessionLocal, init_db
+
+
+@lru_cache(maxsize=None)
+def _auth_session():
+    """One session shared by the authentication tests running in this process"""
+    SessionLocal, _ = _db()
+    return SessionLocal()
+
+
+def _rollback_auth_session():
+    """Clear any failed transaction so the next test starts from a clean session"""
+    if _auth_session.cache_info().currsize:
+        _auth_session().rollback()
+
+
+def _close_auth_session():
+    """Close the shared authentication session if a test opened it"""
+    if _auth_session.cache_info().currsize:
+        _auth_session().close()
+        _auth_session.cache_clear()
+
+
+# Pytest calls the tests directly rather than through _run_group
+atexit.register(_close_auth_session)
+
+
+@lru_cache(maxsize=None)
+def _models():
+    _require('sqlalchemy')
+    from app.models import User, APIKey, Migration
+    return User, APIKey, Migration
+
+
+@lru_cache(maxsize=None)
+def _services():
+    _require('sqlalchemy')
+    from app.services import AuthService, UsageTracker, MigrationService
+    return AuthService, UsageTracker, MigrationService
+
+
+@lru_cache(maxsize=None)
+def _flask_create_app():
+    _require('flask')
+    from flask_app import create_app
+    return create_app
+
+
+@lru_cache(maxsize=None)
+def _fastapi_app():
+    _require('fastapi')
+    from fastapi_app.main import app
+    return app
 
 def test_database():
     """Test database connection"""
@@ -16,9 +102,12 @@ def test_database():
     print("TEST 1: Database Connection")
     print("=" * 60)
 
+    if _skip_unless('app'):
+        return False
+
     try:
-        from app.database import SessionLocal, init_db
-        from app.models import User, APIKey, Migration
+        SessionLocal, init_db = _db()
+        User, APIKey, Migration = _models()
 
         # Try to create session
         db = SessionLocal()
@@ -47,9 +136,12 @@ def test_services():
     print("TEST 2: Services Layer")
     print("=" * 60)
 
+    if _skip_unless('app'):
+        return False
+
     try:
-        from app.database import SessionLocal
-        from app.services import AuthService, UsageTracker, MigrationService
+        SessionLocal, _ = _db()
+        AuthService, UsageTracker, MigrationService = _services()
 
         db = SessionLocal()
 
@@ -79,8 +171,11 @@ def test_flask_app():
     print("TEST 3: Flask Application")
     print("=" * 60)
 
+    if _skip_unless('flask_app'):
+        return False
+
     try:
-        from flask_app import create_app
+        create_app = _flask_create_app()
 
         app = create_app()
         print(f"[OK] Flask app created")
@@ -100,8 +195,11 @@ def test_fastapi_app():
     print("TEST 4: FastAPI Application")
     print("=" * 60)
 
+    if _skip_unless('fastapi_app'):
+        return False
+
     try:
-        from fastapi_app.main import app
+        app = _fastapi_app()
 
         print(f"[OK] FastAPI app created")
         print(f"     Title: {app.title}")
@@ -121,11 +219,13 @@ def test_user_login():
     print("TEST 5: User Authentication")
     print("=" * 60)
 
+    if _skip_unless('app'):
+        return False
+
     try:
-        from app.database import SessionLocal
-        from app.services import AuthService
+        AuthService = _services()[0]
 
-        db = SessionLocal()
+        db = _auth_session()
         auth = AuthService(db)
 
         # Try to authenticate the test user
@@ -138,13 +238,15 @@ def test_user_login():
         else:
             print("[WARNING] Test user not found - run database init first")
 
-        db.close()
         return True
 
     except Exception as e:
         print(f"[ERROR] Authentication test failed: {e}")
         return False
 
+    finally:
+        _rollback_auth_session()
+
 
 def test_api_key():
     """Test API key validation"""
@@ -152,11 +254,13 @@ def test_api_key():
     print("TEST 6: API Key Validation")
     print("=" * 60)
 
+    if _skip_unless('app'):
+        return False
+
     try:
-        from app.database import SessionLocal
-        from app.services import AuthService
+        AuthService = _services()[0]
 
-        db = SessionLocal()
+        db = _auth_session()
         auth = AuthService(db)
 
         # Get API keys for user 1
@@ -176,13 +280,31 @@ def test_api_key():
         else:
             print("[WARNING] No API keys found - create one in Flask dashboard")
 
-        db.close()
         return True
 
     except Exception as e:
         print(f"[ERROR] API key test failed: {e}")
         return False
 
+    finally:
+        _rollback_auth_session()
+
+
+def _run_group(group):
+    """Run a group of tests in order, capturing each one's output"""
+    outcomes = []
+    for test in group:
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            try:
+                result = test()
+            except Exception as e:
+                print(f"[ERROR] Test crashed: {e}")
+                result = False
+        outcomes.append((test.__name__, buf.getvalue(), result))
+    _close_auth_session()
+    return outcomes
+
 
 def main():
     """Run all tests"""
@@ -200,14 +322,26 @@ def main():
         test_api_key
     ]
 
+    # Tests sharing the SQLite file run back to back in one worker;
+    # the Flask and FastAPI imports each get a process of their own
+    groups = [
+        [test_database, test_services, test_user_login, test_api_key],
+        [test_flask_app],
+        [test_fastapi_app],
+    ]
+
+    outcomes = {}
+    with ProcessPoolExecutor(max_workers=min(len(groups), os.cpu_count() or 1)) as ex:
+        for group_outcomes in ex.map(_run_group, groups):
+            for name, output, result in group_outcomes:
+                outcomes[name] = (output, result)
+
+    # Print in suite order so the output reads the same as a sequential run
     results = []
     for test in tests:
-        try:
-            result = test()
-            results.append(result)
-        except Exception as e:
-            print(f"[ERROR] Test crashed: {e}")
-            results.append(False)
+        output, result = outcomes[test.__name__]
+        sys.stdout.write(output)
+        results.append(result)
 
     # Summary
     print("\n" + "=" * 60)